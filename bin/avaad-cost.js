@@ -17,7 +17,7 @@ function main() {
 
   pythonProcess.on('error', (error) => {
     if (error.code === 'ENOENT') {
-      console.error('❌ Python3 not found. Please install Python 3.7 or higher.');
+      console.error('❌ Python3 not found. Please install Python 3.10 or higher.');
     } else {
       console.error('❌ Error running Python:', error.message);
     }
@@ -0,0 +1,30 @@
+"""
+AVAAD Shared Config Cache
+
+Parses YAML config files once per process and shares the result between
+all consumers (cost tracking, security rules, ...). A file is re-parsed
+only when its modification time changes.
+"""
+
+import os
+from functools import lru_cache
+from typing import Any
+
+
+@lru_cache(maxsize=32)
+def _parse_yaml(path: str, mtime_ns: int) -> Any:
+    """Parse a YAML file; cached per (path, mtime) so edits are picked up."""
+    import yaml  # Deferred: only needed when a config file exists
+    with open(path, 'r') as f:
+        return yaml.safe_load(f)
+
+
+def load_yaml(path: str) -> Any:
+    """
+    Load a YAML config file through the shared cache.
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    path = os.path.abspath(path)
+    return _parse_yaml(path, os.stat(path).st_mtime_ns)
@@ -5,16 +5,34 @@ Tracks costs associated with AI agent usage across different models and provider
 Provides budgeting, alerts, and ROI analysis for AI-assisted development.
 """
 
+import atexit
+import heapq
+import io
 import json
+import sys
 import time
+from array import array
+from bisect import bisect_left
+from collections import defaultdict
 from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
+from operator import itemgetter
 from datetime import datetime, timedelta
 from pathlib import Path
-import yaml
 
+try:
+    import orjson  # Optional: much faster JSON encoding/decoding for the cost log
+except ImportError:
+    orjson = None
 
-@dataclass
+try:
+    from core._config_cache import load_yaml
+except ImportError:
+    sys.path.append(str(Path(__file__).parent))
+    from _config_cache import load_yaml
+
+
+@dataclass(slots=True)
 class CostEntry:
     """Represents a single AI interaction cost."""
     timestamp: str
@@ -30,7 +48,11 @@ class CostEntry:
     currency: str = "USD"
 
 
-@dataclass
+# Field names serialized for each log line (avoids asdict's recursive copy)
+_COST_ENTRY_FIELDS = tuple(field.name for field in fields(CostEntry))
+
+
+@dataclass(slots=True)
 class BudgetAlert:
     """Represents a budget alert."""
     level: str  # INFO, WARNING, CRITICAL
@@ -56,20 +78,33 @@ class CostTracker:
     def __init__(self, project_root: str = "."):
         """Initialize cost tracker with project settings."""
         self.project_root = Path(project_root)
-        self.config = self._load_config()
+        self._config: Optional[Dict[str, Any]] = None
         self.cost_log_path = self.project_root / "logs" / "ai_costs.jsonl"
         self.cost_log_path.parent.mkdir(exist_ok=True)
         
         # Ensure log file exists
         if not self.cost_log_path.exists():
             self.cost_log_path.write_text("")
+        
+        # Parsed entries cached from the log, plus the byte offset read so far
+        self._reset_cache()
+        
+        # Append handle kept open between writes; see _append_cost_entry
+        self._log_fh = None
+        self._log_dirty = False
+    
+    @property
+    def config(self) -> Dict[str, Any]:
+        """Cost tracking configuration, loaded on first access."""
+        if self._config is None:
+            self._config = self._load_config()
+        return self._config
     
     def _load_config(self) -> Dict[str, Any]:
         """Load cost tracking configuration."""
         config_path = self.project_root / "config" / "cost-tracking.yaml"
         try:
-            with open(config_path, 'r') as f:
-                return yaml.safe_load(f)
+            return load_yaml(str(config_path))
         except FileNotFoundError:
             return self._get_default_config()
     
@@ -145,9 +180,109 @@ class CostTracker:
         return entry
     
     def _append_cost_entry(self, entry: CostEntry) -> None:
-        """Append cost entry to log file."""
-        with open(self.cost_log_path, 'a') as f:
-            f.write(json.dumps(asdict(entry)) + '\n')
+        """
+        Append cost entry to log file.
+        
+        Writes go through a persistent buffered handle instead of opening
+        and closing the log per entry. Pending data is flushed before the
+        log is read back and when the tracker is closed or the process exits.
+        """
+        # Catch up on lines written by other processes so the offset stays aligned
+        self._load_cost_entries()
+        
+        if orjson is not None:
+            line = orjson.dumps(entry) + b'\n'
+        else:
+            record = {name: getattr(entry, name) for name in _COST_ENTRY_FIELDS}
+            line = (json.dumps(record) + '\n').encode('utf-8')
+        
+        if self._log_fh is None:
+            self._log_fh = open(self.cost_log_path, 'ab', buffering=64 * 1024)
+            atexit.register(self._log_fh.close)
+        self._log_fh.write(line)
+        self._log_dirty = True
+        
+        self._ingest(entry)
+        self._log_offset += len(line)
+    
+    def flush(self) -> None:
+        """Write any buffered cost entries to the log file."""
+        if self._log_dirty:
+            self._log_fh.flush()
+            self._log_dirty = False
+    
+    def close(self) -> None:
+        """Flush pending entries and release the log file handle."""
+        if self._log_fh is not None:
+            self.flush()
+            self._log_fh.close()
+            atexit.unregister(self._log_fh.close)
+            self._log_fh = None
+    
+    def _ingest(self, entry: CostEntry) -> None:
+        """Add an entry to the in-memory cache, parsing its timestamp once."""
+        epoch = datetime.fromisoformat(entry.timestamp).timestamp()
+        cost = float(entry.total_cost)
+        tokens = int(entry.input_tokens + entry.output_tokens)
+        
+        if self._epochs and epoch < self._epochs[-1]:
+            self._chronological = False
+        
+        self._entries.append(entry)
+        self._epochs.append(epoch)
+        self._costs.append(cost)
+        self._tokens.append(tokens)
+        self._agent_ids.append(self._intern(entry.agent, self._agent_index, self._agent_names))
+        self._model_ids.append(self._intern(entry.model, self._model_index, self._model_names))
+        self._story_ids.append(self._intern(entry.story_id, self._story_index, self._story_names))
+        # ISO timestamps start with the YYYY-MM-DD date
+        self._days.append(entry.timestamp[:10])
+    
+    def _reset_cache(self) -> None:
+        """Drop all cached entries so the log is re-read from the start."""
+        self._entries: List[CostEntry] = []
+        self._log_offset = 0
+        
+        # Column-wise copies of the fields the aggregations read, so the hot
+        # loops walk flat arrays instead of touching every CostEntry object
+        self._epochs = array('d')
+        self._costs = array('d')
+        self._tokens = array('q')
+        self._agent_ids = array('l')
+        self._model_ids = array('l')
+        self._story_ids = array('l')
+        self._days: List[str] = []
+        
+        # Agent, model and story names interned to small ints: the columns
+        # above hold ids, *_names maps an id back to its name
+        self._agent_index: Dict[str, int] = {}
+        self._agent_names: List[str] = []
+        self._model_index: Dict[str, int] = {}
+        self._model_names: List[str] = []
+        self._story_index: Dict[Optional[str], int] = {}
+        self._story_names: List[Optional[str]] = []
+        
+        # True while epochs are non-decreasing, which allows binary search
+        self._chronological = True
+        
+        # Running spend per budget period: period -> (start_epoch, total, entries counted)
+        self._running: Dict[str, Tuple[float, float, int]] = {}
+    
+    @staticmethod
+    def _intern(name: Optional[str], index: Dict[Optional[str], int],
+                names: List[Optional[str]]) -> int:
+        """Return the integer id for a name, assigning the next id if new."""
+        name_id = index.get(name)
+        if name_id is None:
+            name_id = index[name] = len(names)
+            names.append(name)
+        return name_id
+    
+    def _window_start(self, start_epoch: float) -> int:
+        """Return the index of the first cached entry at or after start_epoch."""
+        if self._chronological:
+            return bisect_left(self._epochs, start_epoch)
+        return 0
     
     def _check_budget_alerts(self, entry: CostEntry) -> List[BudgetAlert]:
         """Check if current spending triggers budget alerts."""
@@ -212,104 +347,122 @@ class CostTracker:
         else:
             start_time = now - timedelta(days=30)  # Default to 30 days
         
-        entries = self._load_cost_entries()
-        period_entries = [
-            e for e in entries
-            if datetime.fromisoformat(e.timestamp) >= start_time
-        ]
+        start_epoch = start_time.timestamp()
+        self._load_cost_entries()
+        count = len(self._costs)
+        
+        # Same period as last time: only add entries cached since then
+        running = self._running.get(period)
+        if running is not None and running[0] == start_epoch:
+            _, total, counted = running
+            start = counted
+        else:
+            total = 0.0
+            start = self._window_start(start_epoch)
         
-        return sum(e.total_cost for e in period_entries)
+        total += sum(
+            cost
+            for cost, epoch in zip(self._costs[start:], self._epochs[start:])
+            if epoch >= start_epoch
+        )
+        self._running[period] = (start_epoch, total, count)
+        
+        return total
     
     def get_cost_summary(self, days: int = 7) -> Dict[str, Any]:
         """Get comprehensive cost summary for a period."""
         end_date = datetime.now()
-        start_date = end_date - timedelta(days=days)
-        
-        entries = self._load_cost_entries()
-        period_entries = [
-            e for e in entries
-            if datetime.fromisoformat(e.timestamp) >= start_date
-        ]
-        
-        if not period_entries:
+        start_epoch = (end_date - timedelta(days=days)).timestamp()
+        
+        total_cost = 0.0
+        count = 0
+        by_agent = defaultdict(float)
+        by_model = defaultdict(float)
+        by_story = defaultdict(float)
+        daily_breakdown = defaultdict(float)
+        
+        # Filter and group in a single pass over the cached columns,
+        # skipping straight to the first entry inside the period
+        self._load_cost_entries()
+        start = self._window_start(start_epoch)
+        columns = zip(self._epochs[start:], self._costs[start:], self._agent_ids[start:],
+                      self._model_ids[start:], self._story_ids[start:], self._days[start:])
+        agent_names = self._agent_names
+        model_names = self._model_names
+        story_names = self._story_names
+        for epoch, cost, agent_id, model_id, story_id, day in columns:
+            if epoch < start_epoch:
+                continue
+            
+            total_cost += cost
+            count += 1
+            by_agent[agent_names[agent_id]] += cost
+            by_model[model_names[model_id]] += cost
+            story = story_names[story_id]
+            if story:
+                by_story[story] += cost
+            daily_breakdown[day] += cost
+        
+        if not count:
             return {
                 'total_cost': 0.0,
                 'entries': 0,
                 'by_agent': {},
                 'by_model': {},
                 'by_story': {},
-                'daily_breakdown': {}
+                'daily_breakdown': {},
+                'average_per_entry': 0.0
             }
         
-        total_cost = sum(e.total_cost for e in period_entries)
-        
-        # Group by agent
-        by_agent = {}
-        for entry in period_entries:
-            by_agent[entry.agent] = by_agent.get(entry.agent, 0.0) + entry.total_cost
-        
-        # Group by model
-        by_model = {}
-        for entry in period_entries:
-            by_model[entry.model] = by_model.get(entry.model, 0.0) + entry.total_cost
-        
-        # Group by story
-        by_story = {}
-        for entry in period_entries:
-            if entry.story_id:
-                by_story[entry.story_id] = by_story.get(entry.story_id, 0.0) + entry.total_cost
-        
-        # Daily breakdown
-        daily_breakdown = {}
-        for entry in period_entries:
-            date_key = datetime.fromisoformat(entry.timestamp).strftime('%Y-%m-%d')
-            daily_breakdown[date_key] = daily_breakdown.get(date_key, 0.0) + entry.total_cost
-        
         return {
             'total_cost': total_cost,
-            'entries': len(period_entries),
-            'by_agent': by_agent,
-            'by_model': by_model,
-            'by_story': by_story,
-            'daily_breakdown': daily_breakdown,
-            'average_per_entry': total_cost / len(period_entries) if period_entries else 0.0
+            'entries': count,
+            'by_agent': dict(by_agent),
+            'by_model': dict(by_model),
+            'by_story': dict(by_story),
+            'daily_breakdown': dict(daily_breakdown),
+            'average_per_entry': total_cost / count
         }
     
     def get_model_efficiency(self) -> Dict[str, Dict[str, float]]:
         """Compare model efficiency (cost per task)."""
-        entries = self._load_cost_entries()
-        
-        model_stats = {}
-        for entry in entries:
-            model = entry.model
-            if model not in model_stats:
-                model_stats[model] = {'total_cost': 0.0, 'tasks': 0, 'total_tokens': 0}
-            
-            model_stats[model]['total_cost'] += entry.total_cost
-            model_stats[model]['tasks'] += 1
-            model_stats[model]['total_tokens'] += entry.input_tokens + entry.output_tokens
+        self._load_cost_entries()
+        
+        # Per-model accumulators indexed by interned model id
+        count = len(self._model_names)
+        totals = [0.0] * count
+        tasks = [0] * count
+        tokens = [0] * count
+        for model_id, cost, entry_tokens in zip(self._model_ids, self._costs, self._tokens):
+            totals[model_id] += cost
+            tasks[model_id] += 1
+            tokens[model_id] += entry_tokens
         
         efficiency = {}
-        for model, stats in model_stats.items():
+        for model, total_cost, task_count, token_count in zip(self._model_names, totals, tasks, tokens):
             efficiency[model] = {
-                'total_spend': stats['total_cost'],
-                'tasks_completed': stats['tasks'],
-                'cost_per_task': stats['total_cost'] / stats['tasks'] if stats['tasks'] > 0 else 0.0,
-                'tokens_per_task': stats['total_tokens'] / stats['tasks'] if stats['tasks'] > 0 else 0.0,
-                'cost_per_1000_tokens': (stats['total_cost'] / stats['total_tokens'] * 1000) if stats['total_tokens'] > 0 else 0.0
+                'total_spend': total_cost,
+                'tasks_completed': task_count,
+                'cost_per_task': total_cost / task_count if task_count > 0 else 0.0,
+                'tokens_per_task': token_count / task_count if task_count > 0 else 0.0,
+                'cost_per_1000_tokens': (total_cost / token_count * 1000) if token_count > 0 else 0.0
             }
         
         return efficiency
     
     def calculate_roi(self, story_id: str) -> Dict[str, float]:
         """Calculate ROI for a specific story."""
-        entries = self._load_cost_entries()
-        story_entries = [e for e in entries if e.story_id == story_id]
+        self._load_cost_entries()
+        target = self._story_index.get(story_id)
+        story_costs = [
+            cost for story, cost in zip(self._story_ids, self._costs)
+            if story == target
+        ]
         
-        if not story_entries:
+        if not story_costs:
             return {'total_cost': 0.0, 'estimated_hours': 0.0, 'roi_score': 0.0}
         
-        total_cost = sum(e.total_cost for e in story_entries)
+        total_cost = sum(story_costs)
         
         # Estimate hours saved (rough calculation)
         # Assume 1 hour of developer time = $50
@@ -328,57 +481,84 @@ class CostTracker:
         }
     
     def _load_cost_entries(self) -> List[CostEntry]:
-        """Load all cost entries from log file."""
-        if not self.cost_log_path.exists():
-            return []
+        """
+        Load all cost entries from log file.
+        
+        Entries are cached on the instance; only lines appended since the
+        last call are read and parsed.
+        """
+        # Our own buffered writes must be on disk before comparing sizes
+        self.flush()
+        
+        try:
+            size = self.cost_log_path.stat().st_size
+        except FileNotFoundError:
+            self._reset_cache()
+            return self._entries
+        
+        # Log was truncated or replaced - start over
+        if size < self._log_offset:
+            self._reset_cache()
+        
+        if size == self._log_offset:
+            return self._entries
         
-        entries = []
-        with open(self.cost_log_path, 'r') as f:
+        with open(self.cost_log_path, 'rb') as f:
+            f.seek(self._log_offset)
             for line in f:
+                # Leave a partially written trailing line for the next read
+                if not line.endswith(b'\n'):
+                    break
+                self._log_offset += len(line)
                 line = line.strip()
                 if line:
                     try:
-                        data = json.loads(line)
-                        entries.append(CostEntry(**data))
-                    except json.JSONDecodeError:
+                        data = orjson.loads(line) if orjson is not None else json.loads(line)
+                        self._ingest(CostEntry(**data))
+                    except json.JSONDecodeError:  # orjson's error subclasses this
                         continue
         
-        return entries
+        return self._entries
     
     def generate_cost_report(self, days: int = 7) -> str:
         """Generate a user-friendly cost report."""
         summary = self.get_cost_summary(days)
         efficiency = self.get_model_efficiency()
         
-        report = []
-        report.append("💰 AVAAD AI Cost Report")
-        report.append("=" * 50)
-        report.append(f"Period: Last {days} days")
-        report.append(f"Total Spend: ${summary['total_cost']:.2f}")
-        report.append(f"Interactions: {summary['entries']}")
-        report.append(f"Average per interaction: ${summary['average_per_entry']:.3f}")
-        
-        if summary['by_agent']:
-            report.append("\n📊 By Agent:")
-            for agent, cost in sorted(summary['by_agent'].items(), key=lambda x: x[1], reverse=True):
-                report.append(f"  {agent}: ${cost:.2f}")
-        
-        if summary['by_model']:
-            report.append("\n🤖 By Model:")
-            for model, cost in sorted(summary['by_model'].items(), key=lambda x: x[1], reverse=True):
-                report.append(f"  {model}: ${cost:.2f}")
-        
-        if summary['by_story']:
-            report.append("\n📋 By Story:")
-            for story, cost in sorted(summary['by_story'].items(), key=lambda x: x[1], reverse=True)[:5]:
-                report.append(f"  {story}: ${cost:.2f}")
+        by_agent = summary['by_agent']
+        by_model = summary['by_model']
+        by_story = summary['by_story']
+        
+        report = io.StringIO()
+        write = report.write
+        write("💰 AVAAD AI Cost Report\n")
+        write("=" * 50)
+        write(f"\nPeriod: Last {days} days")
+        write(f"\nTotal Spend: ${summary['total_cost']:.2f}")
+        write(f"\nInteractions: {summary['entries']}")
+        write(f"\nAverage per interaction: ${summary['average_per_entry']:.3f}")
+        
+        if by_agent:
+            write("\n\n📊 By Agent:")
+            for agent, cost in sorted(by_agent.items(), key=itemgetter(1), reverse=True):
+                write(f"\n  {agent}: ${cost:.2f}")
+        
+        if by_model:
+            write("\n\n🤖 By Model:")
+            for model, cost in sorted(by_model.items(), key=itemgetter(1), reverse=True):
+                write(f"\n  {model}: ${cost:.2f}")
+        
+        if by_story:
+            write("\n\n📋 By Story:")
+            for story, cost in heapq.nlargest(5, by_story.items(), key=itemgetter(1)):
+                write(f"\n  {story}: ${cost:.2f}")
         
         if efficiency:
-            report.append("\n⚡ Model Efficiency:")
+            write("\n\n⚡ Model Efficiency:")
             for model, stats in efficiency.items():
-                report.append(f"  {model}: ${stats['cost_per_task']:.3f}/task")
+                write(f"\n  {model}: ${stats['cost_per_task']:.3f}/task")
         
-        return "\n".join(report)
+        return report.getvalue()
 
 
 def main():
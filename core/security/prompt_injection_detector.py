@@ -5,14 +5,70 @@ Detects potential prompt injection attacks in AI agent interactions.
 Designed for non-technical users with clear, actionable alerts.
 """
 
+import io
+import multiprocessing
 import re
+import sys
 import json
-from typing import Dict, List, Tuple, Optional
-from dataclasses import dataclass
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Tuple, Optional
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from hashlib import blake2b
 from pathlib import Path
 
+try:
+    import orjson  # Optional: faster JSON Lines parsing
+except ImportError:
+    orjson = None
 
-@dataclass
+try:
+    import ijson  # Optional: streams JSON array logs
+except ImportError:
+    ijson = None
+
+try:
+    from core._config_cache import load_yaml
+except ImportError:
+    sys.path.append(str(Path(__file__).parent.parent))
+    from _config_cache import load_yaml
+
+
+# Interaction count from which scan_agent_interactions uses worker processes
+PARALLEL_SCAN_THRESHOLD = 1000
+
+# How the workers are started. Scans run from threads (the security report,
+# mvp's stages), and forking a multithreaded process can deadlock the child,
+# so workers come from a fork server, or are spawned where there is none.
+SCAN_WORKER_START_METHOD = (
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+# Alert levels that need attention before a story can be completed
+HIGH_SEVERITY_LEVELS = frozenset({'HIGH', 'CRITICAL'})
+
+# Dangerous Python code patterns checked by _check_code_injection
+DANGEROUS_PATTERNS = (
+    (r'\bimport\s+(os|subprocess|sys)\b', 'OS Module Import'),
+    (r'\beval\s*\(', 'Code Execution'),
+    (r'\bexec\s*\(', 'Code Execution'),
+    (r'subprocess\.call|subprocess\.run', 'System Command'),
+    (r'__import__|getattr|setattr', 'Reflection Attack'),
+    (r'\bopen\s*\(\s*["\']/', 'File System Access')
+)
+
+# DANGEROUS_PATTERNS compiled once per process. Each is searched on its own:
+# a fused alternation only reports non-overlapping matches, so a pattern
+# overlapping an earlier one's match (e.g. "import subprocess.run") would be missed.
+CODE_INJECTION_PATTERNS = tuple(
+    (re.compile(pattern, re.IGNORECASE), description)
+    for pattern, description in DANGEROUS_PATTERNS
+)
+
+
+@dataclass(slots=True, frozen=True)
 class SecurityAlert:
     """Represents a security alert with user-friendly details."""
     level: str  # LOW, MEDIUM, HIGH, CRITICAL
@@ -23,6 +79,29 @@ class SecurityAlert:
     agent: Optional[str] = None
 
 
+@lru_cache(maxsize=8)
+def _compile_pattern_matcher(literals: Tuple[str, ...]) -> Tuple[Optional[re.Pattern], Dict[str, List[str]]]:
+    """
+    Compile suspicious phrases into a single multi-literal matcher.
+    
+    The phrases are tried longest-first inside a lookahead, so one pass
+    of finditer reports every position where some phrase starts. Shorter
+    phrases that are a prefix of the one found at a position are credited
+    through the returned prefix map. Cached so that detectors sharing a
+    rule set compile it only once per process.
+    """
+    literals = sorted(literals, key=len, reverse=True)
+    prefixes = {
+        literal: [other for other in literals if other != literal and literal.startswith(other)]
+        for literal in literals
+    }
+    if not literals:
+        return None, prefixes
+    
+    alternation = '|'.join(re.escape(literal) for literal in literals)
+    return re.compile(f'(?=({alternation}))'), prefixes
+
+
 class PromptInjectionDetector:
     """
     Detects prompt injection attempts in AI agent interactions.
@@ -39,13 +118,12 @@ class PromptInjectionDetector:
         self.config_path = config_path or "config/security.yaml"
         self.rules = self._load_rules()
         self.suspicious_patterns = self._get_suspicious_patterns()
+        self._build_pattern_matcher()
     
     def _load_rules(self) -> Dict:
         """Load security rules from config."""
         try:
-            import yaml
-            with open(self.config_path, 'r') as f:
-                return yaml.safe_load(f)
+            return load_yaml(self.config_path)
         except FileNotFoundError:
             return self._get_default_rules()
     
@@ -116,6 +194,25 @@ class PromptInjectionDetector:
         
         return patterns
     
+    def _build_pattern_matcher(self) -> None:
+        """Look up the compiled matcher for this detector's phrases."""
+        literals = tuple(sorted({p for _, p, _ in self.suspicious_patterns if p}))
+        self._pattern_regex, self._pattern_prefixes = _compile_pattern_matcher(literals)
+    
+    def _find_patterns(self, text_lower: str) -> Dict[str, int]:
+        """Return occurrence counts for every suspicious phrase in the text."""
+        counts: Dict[str, int] = {}
+        if self._pattern_regex is None:
+            return counts
+        
+        for match in self._pattern_regex.finditer(text_lower):
+            literal = match.group(1)
+            counts[literal] = counts.get(literal, 0) + 1
+            for prefix in self._pattern_prefixes[literal]:
+                counts[prefix] = counts.get(prefix, 0) + 1
+        
+        return counts
+    
     def analyze_text(self, text: str, agent: Optional[str] = None) -> List[SecurityAlert]:
         """
         Analyze text for prompt injection attempts.
@@ -130,15 +227,17 @@ class PromptInjectionDetector:
         if not text:
             return []
         
-        text_lower = text.lower()
+        # Avoid copying text that is already lowercase (common for code and logs)
+        text_lower = text if text.islower() else text.lower()
         alerts = []
         
-        # Check against suspicious patterns
-        for category, pattern, weight in self.suspicious_patterns:
-            if pattern in text_lower:
-                severity = self._calculate_severity(weight, text_lower, pattern)
-                alert = self._create_alert(category, pattern, severity, text, agent)
-                alerts.append(alert)
+        # Check against suspicious patterns, all found in one pass
+        found = self._find_patterns(text_lower)
+        matched = [entry for entry in self.suspicious_patterns if entry[1] in found]
+        for category, pattern, weight in matched:
+            severity = self._calculate_severity(weight, found[pattern], len(matched))
+            alert = self._create_alert(category, pattern, severity, text, agent)
+            alerts.append(alert)
         
         # Check for code execution attempts
         code_alerts = self._check_code_injection(text, agent)
@@ -146,17 +245,23 @@ class PromptInjectionDetector:
         
         return alerts
     
-    def _calculate_severity(self, base_weight: float, text: str, pattern: str) -> str:
-        """Calculate severity based on context and repetition."""
+    def _calculate_severity(self, base_weight: float, pattern_count: int,
+                            total_patterns: int) -> str:
+        """
+        Calculate severity based on context and repetition.
+        
+        Args:
+            base_weight: Severity weight of the pattern's category
+            pattern_count: Times this pattern occurs in the text
+            total_patterns: Number of distinct suspicious patterns in the text
+        """
         score = base_weight
         
         # Increase score for repetition
-        pattern_count = text.count(pattern)
         if pattern_count > 1:
             score += 0.2 * pattern_count
         
         # Increase score for multiple patterns
-        total_patterns = sum(1 for _, p, _ in self.suspicious_patterns if p in text)
         if total_patterns > 2:
             score += 0.3
         
@@ -178,19 +283,8 @@ class PromptInjectionDetector:
         """Check for malicious code injection attempts."""
         alerts = []
         
-        # Check for dangerous Python code patterns
-        dangerous_patterns = [
-            (r'\bimport\s+(os|subprocess|sys)\b', 'OS Module Import'),
-            (r'\beval\s*\(', 'Code Execution'),
-            (r'\bexec\s*\(', 'Code Execution'),
-            (r'subprocess\.call|subprocess\.run', 'System Command'),
-            (r'__import__|getattr|setattr', 'Reflection Attack'),
-            (r'\bopen\s*\(\s*["\']/', 'File System Access')
-        ]
-        
-        for pattern, description in dangerous_patterns:
-            import re
-            if re.search(pattern, text, re.IGNORECASE):
+        for pattern, description in CODE_INJECTION_PATTERNS:
+            if pattern.search(text):
                 alert = SecurityAlert(
                     level='HIGH',
                     title=f'Potential {description}',
@@ -222,21 +316,107 @@ class PromptInjectionDetector:
             agent=agent
         )
     
+    def _iter_interactions(self, f: BinaryIO) -> Iterator[Dict]:
+        """
+        Yield interactions from an open (binary) log file.
+        
+        JSON Lines logs, one interaction per line, are streamed and malformed
+        lines are skipped. A JSON array log is streamed with ijson when it is
+        installed and loaded in one go otherwise (parsed with orjson when
+        available, like the lines); an invalid array yields nothing (or stops
+        at the first error when streaming).
+        """
+        # Find the first non-whitespace byte to tell the two formats apart
+        is_array = False
+        while True:
+            chunk = f.read(4096)
+            if not chunk:
+                return
+            stripped = chunk.lstrip()
+            if stripped:
+                is_array = stripped.startswith(b'[')
+                f.seek(0)
+                break
+        
+        loads = orjson.loads if orjson is not None else json.loads
+        if is_array:
+            if ijson is not None:
+                try:
+                    yield from ijson.items(f, 'item')
+                except ijson.JSONError:
+                    return
+            else:
+                try:
+                    interactions = loads(f.read())
+                except json.JSONDecodeError:
+                    return
+                yield from interactions
+            return
+        
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                interaction = loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(interaction, dict):
+                yield interaction
+    
     def scan_agent_interactions(self, log_file: str) -> List[SecurityAlert]:
-        """Scan historical agent interactions for security issues."""
+        """Scan historical agent interactions (JSON Lines or JSON array) for security issues."""
         try:
-            with open(log_file, 'r') as f:
-                interactions = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
+            with open(log_file, 'rb') as f:
+                return self._scan_interactions(self._iter_interactions(f))
+        except FileNotFoundError:
             return []
+    
+    def _scan_interactions(self, interactions: Iterable[Dict]) -> List[SecurityAlert]:
+        """
+        Analyze a stream of interactions, in parallel once the stream is large.
+        
+        Logs repeat texts verbatim (retries, boilerplate), so each distinct
+        text is analyzed once and its alerts are reused for every repeat,
+        re-labelled with the repeating interaction's agent.
+        """
+        text_index: Dict[bytes, int] = {}  # text digest -> index of its first occurrence
+        scanned_agents: List[Optional[str]] = []  # agent each distinct text was analyzed with
+        occurrences: List[Tuple[int, Optional[str]]] = []  # (text index, agent) per interaction
+        
+        def distinct_texts() -> Iterator[Tuple[str, Optional[str]]]:
+            for interaction in interactions:
+                text = interaction.get('prompt', '') + ' ' + interaction.get('response', '')
+                agent = interaction.get('agent')
+                digest = blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+                index = text_index.get(digest)
+                if index is None:
+                    index = text_index[digest] = len(scanned_agents)
+                    scanned_agents.append(agent)
+                    yield text, agent
+                occurrences.append((index, agent))
+        
+        texts = distinct_texts()
+        
+        # Buffer up to the threshold to decide between serial and parallel scanning
+        head = list(islice(texts, PARALLEL_SCAN_THRESHOLD))
+        
+        if len(head) >= PARALLEL_SCAN_THRESHOLD:
+            # Large logs: fan out to worker processes, each with its own detector
+            with ProcessPoolExecutor(
+                mp_context=multiprocessing.get_context(SCAN_WORKER_START_METHOD),
+                initializer=_init_scan_worker, initargs=(self.config_path,)
+            ) as executor:
+                results = list(executor.map(_scan_in_worker, chain(head, texts), chunksize=64))
+        else:
+            results = [self.analyze_text(text, agent) for text, agent in head]
         
         all_alerts = []
-        for interaction in interactions:
-            alerts = self.analyze_text(
-                interaction.get('prompt', '') + ' ' + interaction.get('response', ''),
-                interaction.get('agent')
-            )
-            all_alerts.extend(alerts)
+        for index, agent in occurrences:
+            alerts = results[index]
+            if agent == scanned_agents[index]:
+                all_alerts.extend(alerts)
+            else:
+                all_alerts.extend(replace(alert, agent=agent) for alert in alerts)
         
         return all_alerts
     
@@ -245,27 +425,42 @@ class PromptInjectionDetector:
         if not alerts:
             return "✅ No security issues detected in agent interactions."
         
-        report = []
-        report.append("🛡️  AVAAD Security Report")
-        report.append("=" * 50)
+        report = io.StringIO()
+        write = report.write
+        write("🛡️  AVAAD Security Report\n")
+        write("=" * 50)
         
         # Group by severity
-        severity_groups = {}
+        severity_groups = defaultdict(list)
         for alert in alerts:
-            if alert.level not in severity_groups:
-                severity_groups[alert.level] = []
             severity_groups[alert.level].append(alert)
         
-        for severity in ['CRITICAL', 'HIGH', 'MEDIUM', 'LOW']:
-            if severity in severity_groups:
-                report.append(f"\n{severity} ({len(severity_groups[severity])} issues):")
-                for alert in severity_groups[severity]:
-                    report.append(f"  • {alert.title}")
-                    report.append(f"    {alert.description}")
+        for severity in ('CRITICAL', 'HIGH', 'MEDIUM', 'LOW'):
+            group = severity_groups.get(severity)
+            if group:
+                write(f"\n\n{severity} ({len(group)} issues):")
+                for alert in group:
+                    write(f"\n  • {alert.title}\n    {alert.description}")
                     if alert.agent:
-                        report.append(f"    Agent: {alert.agent}")
+                        write(f"\n    Agent: {alert.agent}")
         
-        return "\n".join(report)
+        return report.getvalue()
+
+
+# Detector owned by each scan worker process, built once by _init_scan_worker
+_worker_detector: Optional[PromptInjectionDetector] = None
+
+
+def _init_scan_worker(config_path: str) -> None:
+    """Build the per-process detector used by _scan_in_worker."""
+    global _worker_detector
+    _worker_detector = PromptInjectionDetector(config_path)
+
+
+def _scan_in_worker(item: Tuple[str, Optional[str]]) -> List[SecurityAlert]:
+    """Analyze one (text, agent) pair inside a scan worker process."""
+    text, agent = item
+    return _worker_detector.analyze_text(text, agent)
 
 
 def main():
@@ -274,7 +469,7 @@ def main():
     
     if len(sys.argv) < 2:
         print("Usage: python prompt_injection_detector.py <text_to_analyze>")
-        print("       python prompt_injection_detector.py --file <log_file.json>")
+        print("       python prompt_injection_detector.py --file <log_file.jsonl>")
         sys.exit(1)
     
     detector = PromptInjectionDetector()
@@ -5,13 +5,100 @@ Validates AI agent outputs to ensure they match actual implementation.
 Prevents false claims of completion by verifying against real code changes.
 """
 
+import ast
+import io
+import os
 import re
-import json
-import subprocess
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple, Optional, Any
 from dataclasses import dataclass
 from pathlib import Path
-import yaml
+
+try:
+    import hyperscan  # Optional: vectorized multi-literal scan for claim triggers
+except ImportError:
+    hyperscan = None
+
+try:
+    from core._config_cache import load_yaml
+except ImportError:
+    sys.path.append(str(Path(__file__).parent.parent))
+    from _config_cache import load_yaml
+
+
+# Common claim patterns: (claim type, regex with an optional "value" group, value converter).
+# [^\S\n] is whitespace other than a newline, so no claim spans two lines, and
+# values end on a non-space character as if the line had been stripped.
+CLAIM_PATTERNS = (
+    ('errors_fixed', r'(?:fixed|resolved|addressed)[^\S\n]+(?P<value>\d+)[^\S\n]+.*error', int),
+    ('tests_added', r'(?:added|implemented|created)[^\S\n]+(?P<value>\w+.*test)', str),
+    ('files_modified', r'(?:updated|modified)[^\S\n]+(?P<value>.+\.py)', str),
+    ('test_coverage', r'(?:coverage|test coverage)[^\S\n]+(?P<value>\d+)%', float),
+    ('refactoring', r'(?:refactored|improved)[^\S\n]+(?P<value>.*\S)', str),
+    ('documentation', r'(?:documentation|docs)[^\S\n]+(?:updated|added)', bool)
+)
+
+# All claim patterns fused into one regex: group <type> per pattern and
+# <type>_value for its value. The alternation sits in a lookahead so a single
+# scan reports every position where some claim starts.
+CLAIM_REGEX = re.compile(
+    '(?=' + '|'.join(
+        f'(?P<{claim_type}>' + pattern.replace('(?P<value>', f'(?P<{claim_type}_value>') + ')'
+        for claim_type, pattern, _ in CLAIM_PATTERNS
+    ) + ')',
+    re.IGNORECASE
+)
+
+# Lowercase words every claim starts with (or, for "test coverage", contains)
+CLAIM_TRIGGERS = (
+    'fixed', 'resolved', 'addressed', 'added', 'implemented', 'created',
+    'updated', 'modified', 'coverage', 'refactored', 'improved',
+    'documentation', 'docs'
+)
+
+# Finds every (possibly overlapping) trigger position in lowercased text.
+# A case-sensitive literal scan is far cheaper than trying CLAIM_REGEX at
+# every position, so CLAIM_REGEX only runs where a claim can start.
+CLAIM_START_REGEX = re.compile('(?=' + '|'.join(CLAIM_TRIGGERS) + ')')
+
+
+def _compile_trigger_database():
+    """Compile CLAIM_TRIGGERS into a caseless Hyperscan database, if available."""
+    if hyperscan is None:
+        return None
+    database = hyperscan.Database()
+    database.compile(
+        expressions=[trigger.encode('ascii') for trigger in CLAIM_TRIGGERS],
+        ids=list(range(len(CLAIM_TRIGGERS))),
+        elements=len(CLAIM_TRIGGERS),
+        flags=[hyperscan.HS_FLAG_CASELESS] * len(CLAIM_TRIGGERS)
+    )
+    return database
+
+
+# Hyperscan replacement for CLAIM_START_REGEX on ASCII text (None without hyperscan)
+CLAIM_TRIGGER_DATABASE = _compile_trigger_database()
+
+# Overall score weights (sum to 1.0) and the penalty per false claim
+CLAIMS_WEIGHT = 0.3
+QUALITY_WEIGHT = 0.25
+TESTS_WEIGHT = 0.25
+DOCUMENTATION_WEIGHT = 0.2
+FALSE_CLAIM_PENALTY = 0.2
+
+# Outcome counts in the pytest summary line
+PYTEST_SUMMARY_REGEX = re.compile(r'(\d+) (passed|failed)\b')
+
+# AST nodes that are expected to carry a docstring
+DOCUMENTED_NODES = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+
+# (claim type, value group name or None, value converter) in pattern order
+CLAIM_TYPES = tuple(
+    (claim_type, f'{claim_type}_value' if '(?P<value>' in pattern else None, value_type)
+    for claim_type, pattern, value_type in CLAIM_PATTERNS
+)
 
 
 @dataclass
@@ -40,13 +127,57 @@ class LLMOutputValidator:
         """Initialize with project root."""
         self.project_root = Path(project_root)
         self.config = self._load_config()
+        # Tool results per sorted file set; each tool runs once per instance
+        self._mypy_cache: Dict[Tuple[str, ...], int] = {}
+        self._pytest_cache: Dict[Tuple[str, ...], Dict[str, Any]] = {}
+        # Tool subprocesses still running, killed by cancel
+        self._running = set()
+        self._running_lock = threading.Lock()
+        self._cancelled = threading.Event()
+    
+    def cancel(self) -> None:
+        """
+        Stop the tools this validator is running, e.g. once another check has failed.
+        
+        Their subprocesses are killed and no new ones are started; the
+        interrupted validation's result should be ignored.
+        """
+        self._cancelled.set()
+        with self._running_lock:
+            for process in self._running:
+                process.kill()
+    
+    def _run_tool(self, command: List[str]):
+        """
+        Run a tool in the project root, capturing its text output.
+        
+        Like subprocess.run, but killed by cancel.
+        
+        Raises:
+            RuntimeError: If the validation was cancelled
+        """
+        import subprocess  # Deferred: only needed when a tool actually runs
+        with subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                              text=True, cwd=self.project_root) as process:
+            with self._running_lock:
+                self._running.add(process)
+                if self._cancelled.is_set():
+                    process.kill()
+            try:
+                stdout, stderr = process.communicate()
+            finally:
+                with self._running_lock:
+                    self._running.discard(process)
+        
+        if self._cancelled.is_set():
+            raise RuntimeError("validation cancelled")
+        return subprocess.CompletedProcess(command, process.returncode, stdout, stderr)
     
     def _load_config(self) -> Dict:
         """Load validation configuration."""
         config_path = self.project_root / "config" / "validation.yaml"
         try:
-            with open(config_path, 'r') as f:
-                return yaml.safe_load(f)
+            return load_yaml(str(config_path))
         except FileNotFoundError:
             return self._get_default_config()
     
@@ -108,27 +239,48 @@ class LLMOutputValidator:
             'claims_total': 0
         }
         
+        # Drop duplicate paths (keeping order) and classify the files once
+        if files_changed:
+            files_changed = list(dict.fromkeys(files_changed))
+        file_groups = self._group_files(files_changed)
+        
         # 1. Parse agent claims from output
         claims = self._extract_claims(agent_output)
         evidence['claims_total'] = len(claims)
         
-        # 2. Verify claims against actual code
-        claim_results = self._verify_claims(claims, files_changed)
-        evidence['claims_matched'] = sum(1 for r in claim_results if r['matched'])
-        
-        # 3. Check code quality
-        quality_result = self._check_code_quality(files_changed)
-        evidence['code_quality_score'] = quality_result['score']
-        evidence['files_checked'] = quality_result['files_checked']
-        
-        # 4. Validate tests
-        test_result = self._validate_tests(files_changed)
-        evidence['tests_passed'] = test_result['passed']
-        evidence['tests_total'] = test_result['total']
-        
-        # 5. Check documentation
-        doc_result = self._check_documentation(files_changed)
-        evidence['documentation_score'] = doc_result['score']
+        # Run the independent, I/O-bound work (tool subprocesses, file reads)
+        # in the background and collect each result when a step needs it
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            tests_future = executor.submit(self._validate_tests, files_changed, file_groups)
+            contents_future = executor.submit(self._read_python_files, file_groups['python'])
+            mypy_future = None
+            if files_changed and any(claim['type'] == 'errors_fixed' for claim in claims):
+                mypy_future = executor.submit(self._count_mypy_errors, files_changed)
+            
+            # 2. Verify claims against actual code
+            if mypy_future is not None:
+                mypy_future.result()  # _verify_claims then reads the cached count
+            claim_results = self._verify_claims(claims, files_changed, file_groups)
+            evidence['claims_matched'] = sum(1 for r in claim_results if r['matched'])
+            false_claims = sum(1 for r in claim_results if r['type'] == 'false_claim')
+            
+            # Each changed Python file is read once for the checks below
+            file_contents = contents_future.result()
+            
+            # 3. Check code quality
+            quality_result = self._check_code_quality(files_changed, file_contents)
+            evidence['code_quality_score'] = quality_result['score']
+            evidence['files_checked'] = quality_result['files_checked']
+            
+            # 4. Validate tests
+            test_result = tests_future.result()
+            evidence['tests_passed'] = test_result['passed']
+            evidence['tests_total'] = test_result['total']
+            
+            # 5. Check documentation
+            doc_result = self._check_documentation(files_changed, file_contents,
+                                                   quality_result['syntax_trees'])
+            evidence['documentation_score'] = doc_result['score']
         
         # Compile issues and recommendations
         issues.extend(claim_results)
@@ -141,7 +293,7 @@ class LLMOutputValidator:
         recommendations.extend(doc_result['recommendations'])
         
         # Calculate overall score
-        score = self._calculate_overall_score(evidence, issues)
+        score = self._calculate_overall_score(evidence, false_claims)
         
         return ValidationResult(
             is_valid=score >= 0.7,
@@ -154,40 +306,110 @@ class LLMOutputValidator:
     def _extract_claims(self, agent_output: str) -> List[Dict[str, Any]]:
         """Extract verifiable claims from agent output."""
         claims = []
-        lines = agent_output.split('\n')
+        if CLAIM_TRIGGER_DATABASE is not None and agent_output.isascii():
+            # ASCII only: byte offsets from Hyperscan are then string offsets
+            starts = self._scan_claim_starts(agent_output)
+        else:
+            output_lower = agent_output.lower()
+            if len(output_lower) == len(agent_output):
+                starts = (start.start() for start in CLAIM_START_REGEX.finditer(output_lower))
+            else:
+                # lower() changed the length (rare non-ASCII text), so positions
+                # do not carry over; scan the original case-insensitively instead
+                starts = None
         
-        for line in lines:
-            line = line.strip()
-            if not line:
+        if starts is not None:
+            matches = (CLAIM_REGEX.match(agent_output, start) for start in starts)
+        else:
+            matches = CLAIM_REGEX.finditer(agent_output)
+        
+        # One scan of the whole output. Matches arrive in position order, so
+        # they are grouped per line, keeping the first (leftmost) of each type.
+        line_end = -1
+        found = {}
+        for match in matches:
+            if match is None:
                 continue
-            
-            # Common claim patterns
-            claim_patterns = [
-                (r'(?:fixed|resolved|addressed)\s+(\d+)\s+.*error', 'errors_fixed', int),
-                (r'(?:added|implemented|created)\s+(\w+.*test)', 'tests_added', str),
-                (r'(?:updated|modified)\s+(.+\.py)', 'files_modified', str),
-                (r'(?:coverage|test coverage)\s+(\d+)%', 'test_coverage', float),
-                (r'(?:refactored|improved)\s+(.+)', 'refactoring', str),
-                (r'(?:documentation|docs)\s+(?:updated|added)', 'documentation', bool)
-            ]
-            
-            for pattern, claim_type, value_type in claim_patterns:
-                match = re.search(pattern, line, re.IGNORECASE)
-                if match:
-                    claims.append({
-                        'type': claim_type,
-                        'value': value_type(match.group(1)) if match.group(1) else True,
-                        'original_text': line,
-                        'confidence': 0.8
-                    })
+            if match.start() > line_end:
+                self._add_line_claims(claims, agent_output, line_end, found)
+                line_end = agent_output.find('\n', match.start())
+                if line_end == -1:
+                    line_end = len(agent_output)
+                found = {}
+            found.setdefault(match.lastgroup, match)
+        self._add_line_claims(claims, agent_output, line_end, found)
         
         return claims
     
-    def _verify_claims(self, claims: List[Dict], files_changed: List[str]) -> List[Dict]:
+    @staticmethod
+    def _scan_claim_starts(agent_output: str) -> List[int]:
+        """Return the sorted start offsets of claim triggers in ASCII text, via Hyperscan."""
+        starts = set()
+        
+        def on_match(trigger_id, start, end, flags, context):
+            # Matches are reported by end offset; triggers are fixed literals
+            starts.add(end - len(CLAIM_TRIGGERS[trigger_id]))
+        
+        CLAIM_TRIGGER_DATABASE.scan(agent_output.encode('ascii'), match_event_handler=on_match)
+        return sorted(starts)
+    
+    @staticmethod
+    def _add_line_claims(claims: List[Dict[str, Any]], agent_output: str,
+                         line_end: int, found: Dict[str, Any]) -> None:
+        """Append the claims found on the line ending at line_end, in pattern order."""
+        if not found:
+            return
+        
+        line_start = agent_output.rfind('\n', 0, line_end) + 1
+        line = agent_output[line_start:line_end].strip()
+        for claim_type, value_group, value_type in CLAIM_TYPES:
+            match = found.get(claim_type)
+            if match:
+                value = match.group(value_group) if value_group else None
+                claims.append({
+                    'type': claim_type,
+                    'value': value_type(value) if value else True,
+                    'original_text': line,
+                    'confidence': 0.8
+                })
+    
+    @staticmethod
+    def _group_files(files: Optional[List[str]]) -> Dict[str, Tuple[str, ...]]:
+        """
+        Classify changed files in a single pass.
+        
+        Returns:
+            Dict with 'python' (.py files), 'tests' (paths mentioning "test"),
+            'python_tests' (both) and 'docs' (.md files or paths mentioning "doc")
+        """
+        python, tests, python_tests, docs = [], [], [], []
+        for file_path in files or ():
+            path_lower = file_path.lower()
+            is_python = file_path.endswith('.py')
+            if is_python:
+                python.append(file_path)
+            if 'test' in path_lower:
+                tests.append(file_path)
+                if is_python:
+                    python_tests.append(file_path)
+            if file_path.endswith('.md') or 'doc' in path_lower:
+                docs.append(file_path)
+        
+        return {
+            'python': tuple(python),
+            'tests': tuple(tests),
+            'python_tests': tuple(python_tests),
+            'docs': tuple(docs)
+        }
+    
+    def _verify_claims(self, claims: List[Dict], files_changed: List[str],
+                       file_groups: Optional[Dict[str, Tuple[str, ...]]] = None) -> List[Dict]:
         """Verify claims against actual code changes."""
         if not files_changed:
             return [{'type': 'missing_files', 'message': 'No files specified for validation'}]
         
+        if file_groups is None:
+            file_groups = self._group_files(files_changed)
         issues = []
         
         for claim in claims:
@@ -200,16 +422,14 @@ class LLMOutputValidator:
                         'matched': False
                     })
             elif claim['type'] == 'tests_added':
-                test_files = [f for f in files_changed if 'test' in f.lower()]
-                if not test_files:
+                if not file_groups['tests']:
                     issues.append({
                         'type': 'missing_tests',
                         'message': 'Agent claimed to add tests but no test files found',
                         'matched': False
                     })
             elif claim['type'] == 'documentation':
-                doc_files = [f for f in files_changed if f.endswith('.md') or 'doc' in f.lower()]
-                if not doc_files:
+                if not file_groups['docs']:
                     issues.append({
                         'type': 'missing_documentation',
                         'message': 'Agent claimed to update documentation but no doc files changed',
@@ -226,61 +446,98 @@ class LLMOutputValidator:
         return issues
     
     def _count_mypy_errors(self, files: List[str]) -> int:
-        """Count MyPy errors in specified files."""
+        """Count MyPy errors in specified files (cached per file set)."""
+        key = tuple(sorted(files))
+        if key not in self._mypy_cache:
+            self._mypy_cache[key] = self._run_mypy(files)
+        return self._mypy_cache[key]
+    
+    def _run_mypy(self, files: List[str]) -> int:
+        """Run MyPy on the files and count error lines."""
         try:
-            result = subprocess.run(
-                ['mypy', '--strict'] + files,
-                capture_output=True,
-                text=True,
-                cwd=self.project_root
-            )
+            result = self._run_tool(['mypy', '--strict'] + files)
             # Count error lines
-            error_lines = [line for line in result.stdout.split('\n') if 'error:' in line]
-            return len(error_lines)
+            return sum(1 for line in result.stdout.splitlines() if 'error:' in line)
         except Exception:
             return 0
     
-    def _check_code_quality(self, files: List[str]) -> Dict[str, Any]:
+    def _read_python_files(self, files: Optional[List[str]]) -> Dict[str, Any]:
+        """
+        Read the changed Python files once for all checks.
+        
+        Returns:
+            Mapping of file path to its raw bytes, or to the exception raised
+            while reading it. Missing files are left out. The checks only look
+            for ASCII markers, and ast.parse accepts bytes (honouring any
+            encoding declaration), so nothing is decoded up front.
+        """
+        contents = {}
+        for file_path in files or ():
+            if not file_path.endswith('.py') or file_path in contents:
+                continue
+            
+            full_path = self.project_root / file_path
+            if not full_path.exists():
+                continue
+            
+            try:
+                contents[file_path] = full_path.read_bytes()
+            except Exception as e:
+                contents[file_path] = e
+        
+        return contents
+    
+    def _check_code_quality(self, files: List[str],
+                            file_contents: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Check code quality of changed files."""
         if not files:
-            return {'score': 0.5, 'issues': [], 'recommendations': [], 'files_checked': []}
+            return {'score': 0.5, 'issues': [], 'recommendations': [], 'files_checked': [],
+                    'syntax_trees': {}}
+        
+        if file_contents is None:
+            file_contents = self._read_python_files(files)
         
         score = 0.8  # Base score
         issues = []
         recommendations = []
         files_checked = []
+        syntax_trees = {}  # Parsed modules, reused by _check_documentation
         
         for file_path in files:
             if not file_path.endswith('.py'):
                 continue
                 
-            full_path = self.project_root / file_path
-            if not full_path.exists():
+            if file_path not in file_contents:
                 continue
             
             files_checked.append(file_path)
             
+            content = file_contents[file_path]
+            if isinstance(content, Exception):
+                issues.append(f"Could not check {file_path}: {content}")
+                score -= 0.1
+                continue
+            
             try:
-                with open(full_path, 'r') as f:
-                    content = f.read()
-                
                 # Basic quality checks
                 if len(content) > 1000:
                     score -= 0.1  # Large files might need refactoring
                 
                 # Check for basic Python syntax
                 try:
-                    compile(content, str(full_path), 'exec')
+                    syntax_trees[file_path] = ast.parse(content, filename=str(self.project_root / file_path))
                 except SyntaxError as e:
                     issues.append(f"Syntax error in {file_path}: {e}")
                     score -= 0.3
                 
-                # Check for common issues
-                if 'TODO' in content or 'FIXME' in content:
+                # Check for common issues. Plain substring tests on purpose: each
+                # is a C-level fast search and they short-circuit, which beats a
+                # single regex alternation that is tried at every position.
+                if b'TODO' in content or b'FIXME' in content:
                     issues.append(f"TODO/FIXME comments found in {file_path}")
                     score -= 0.05
                 
-                if 'print(' in content and 'logging' not in content:
+                if b'print(' in content and b'logging' not in content:
                     recommendations.append(f"Consider using logging instead of print() in {file_path}")
                 
             except Exception as e:
@@ -291,47 +548,70 @@ class LLMOutputValidator:
             'score': max(0.0, score),
             'issues': issues,
             'recommendations': recommendations,
-            'files_checked': files_checked
+            'files_checked': files_checked,
+            'syntax_trees': syntax_trees
         }
     
-    def _validate_tests(self, files: List[str]) -> Dict[str, Any]:
-        """Validate test coverage and results."""
+    def _validate_tests(self, files: List[str],
+                        file_groups: Optional[Dict[str, Tuple[str, ...]]] = None) -> Dict[str, Any]:
+        """Validate test coverage and results (cached per file set)."""
+        key = tuple(sorted(files))
+        if key not in self._pytest_cache:
+            if file_groups is None:
+                file_groups = self._group_files(files)
+            self._pytest_cache[key] = self._run_tests(file_groups['python_tests'])
+        return self._pytest_cache[key]
+    
+    @staticmethod
+    def _has_test_file(root: Path) -> bool:
+        """Return True as soon as a test_*.py or *test.py file is found under root."""
+        pending = [root]
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.name.endswith('.py') and (
+                                entry.name.startswith('test_') or entry.name.endswith('test.py')):
+                            return True
+            except OSError:
+                continue
+        return False
+    
+    def _run_tests(self, test_files: Tuple[str, ...]) -> Dict[str, Any]:
+        """Look for tests and run them with pytest."""
         issues = []
         recommendations = []
         
         # Check if test files exist
-        test_files = [f for f in files if 'test' in f.lower() and f.endswith('.py')]
-        
         if not test_files:
             # Look for test files in project
             test_dirs = ['tests', 'test']
-            test_files_found = []
-            for test_dir in test_dirs:
-                test_path = self.project_root / test_dir
-                if test_path.exists():
-                    test_files_found.extend(list(test_path.rglob('test_*.py')))
-                    test_files_found.extend(list(test_path.rglob('*test.py')))
-            
-            if not test_files_found:
+            if not any(self._has_test_file(self.project_root / test_dir) for test_dir in test_dirs):
                 issues.append("No test files found")
                 recommendations.append("Add tests to verify functionality")
                 return {'passed': 0, 'total': 0, 'issues': issues, 'recommendations': recommendations}
         
         # Try to run tests
+        import tempfile
         try:
-            result = subprocess.run(
-                ['python', '-m', 'pytest', '--tb=short', '-q'],
-                capture_output=True,
-                text=True,
-                cwd=self.project_root
-            )
+            with tempfile.TemporaryDirectory() as report_dir:
+                report_path = Path(report_dir) / 'pytest.xml'
+                result = self._run_tool(
+                    ['python', '-m', 'pytest', '--tb=no', '-q', f'--junitxml={report_path}']
+                )
+                counts = self._read_junit_counts(report_path)
             
-            # Parse pytest output
-            output = result.stdout + result.stderr
+            if counts is None:
+                # No report written (e.g. pytest crashed early): fall back to
+                # the final summary line, e.g. "1 failed, 3 passed in 0.12s"
+                summary = result.stdout.rstrip().rpartition('\n')[2]
+                outcomes = {outcome: int(count) for count, outcome in PYTEST_SUMMARY_REGEX.findall(summary)}
+                counts = (outcomes.get('passed', 0), outcomes.get('failed', 0))
             
             # Count tests
-            passed = output.count('PASSED')
-            failed = output.count('FAILED')
+            passed, failed = counts
             total = passed + failed
             
             return {
@@ -349,39 +629,87 @@ class LLMOutputValidator:
                 'recommendations': ["Install pytest: pip install pytest"]
             }
     
-    def _check_documentation(self, files: List[str]) -> Dict[str, Any]:
-        """Check documentation completeness."""
+    @staticmethod
+    def _read_junit_counts(report_path: Path) -> Optional[Tuple[int, int]]:
+        """
+        Read (passed, failed) from a pytest JUnit XML report.
+        
+        Errors count as failures; skipped tests are left out. Returns None
+        when the report is missing or unreadable.
+        """
+        from xml.etree import ElementTree  # Deferred: only needed after a test run
+        try:
+            root = ElementTree.parse(report_path).getroot()
+        except (OSError, ElementTree.ParseError):
+            return None
+        
+        passed = failed = 0
+        for suite in root.iter('testsuite'):
+            tests = int(suite.get('tests', 0))
+            suite_failed = int(suite.get('failures', 0)) + int(suite.get('errors', 0))
+            passed += tests - suite_failed - int(suite.get('skipped', 0))
+            failed += suite_failed
+        
+        return passed, failed
+    
+    def _check_documentation(self, files: List[str],
+                             file_contents: Optional[Dict[str, Any]] = None,
+                             syntax_trees: Optional[Dict[str, ast.Module]] = None) -> Dict[str, Any]:
+        """
+        Check documentation completeness.
+        
+        Functions and classes are checked for docstrings on the parsed module,
+        taken from syntax_trees when _check_code_quality already built it.
+        """
         issues = []
         recommendations = []
         score = 1.0
         
+        if file_contents is None:
+            file_contents = self._read_python_files(files)
+        
+        # README is read once, not once per changed file
+        readme_content = None
+        readme_path = self.project_root / "README.md"
+        if file_contents and readme_path.exists():
+            try:
+                with open(readme_path, 'r') as f:
+                    readme_content = f.read()
+            except Exception:
+                pass
+        
         for file_path in files:
             if not file_path.endswith('.py'):
                 continue
-                
-            full_path = self.project_root / file_path
-            if not full_path.exists():
+            
+            content = file_contents.get(file_path)
+            if content is None or isinstance(content, Exception):
                 continue
             
             try:
-                with open(full_path, 'r') as f:
-                    content = f.read()
-                
                 # Check for docstrings
-                if 'def ' in content and '"""' not in content:
+                tree = syntax_trees.get(file_path) if syntax_trees is not None else None
+                if tree is None:
+                    try:
+                        tree = ast.parse(content)
+                    except SyntaxError:
+                        tree = None
+                
+                if tree is not None:
+                    if any(isinstance(node, DOCUMENTED_NODES) and ast.get_docstring(node) is None
+                           for node in ast.walk(tree)):
+                        issues.append(f"Missing docstrings in {file_path}")
+                        score -= 0.1
+                elif b'def ' in content and b'"""' not in content:
+                    # Unparseable file: fall back to a textual heuristic
                     issues.append(f"Missing docstrings in {file_path}")
                     score -= 0.1
                 
                 # Check for README updates if significant changes
-                if len(content) > 100:
-                    readme_path = self.project_root / "README.md"
-                    if readme_path.exists():
-                        with open(readme_path, 'r') as f:
-                            readme_content = f.read()
-                        
-                        # Basic check - could be more sophisticated
-                        if file_path not in readme_content:
-                            recommendations.append(f"Consider updating README.md to mention changes in {file_path}")
+                if len(content) > 100 and readme_content is not None:
+                    # Basic check - could be more sophisticated
+                    if file_path not in readme_content:
+                        recommendations.append(f"Consider updating README.md to mention changes in {file_path}")
                 
             except Exception:
                 continue
@@ -392,36 +720,27 @@ class LLMOutputValidator:
             'recommendations': recommendations
         }
     
-    def _calculate_overall_score(self, evidence: Dict, issues: List) -> float:
+    def _calculate_overall_score(self, evidence: Dict, false_claims: int) -> float:
         """Calculate overall validation score."""
-        weights = {
-            'claims_matched': 0.3,
-            'code_quality_score': 0.25,
-            'test_coverage': 0.25,
-            'documentation_score': 0.2
-        }
+        tests_total = evidence['tests_total']
+        claims_total = evidence['claims_total']
         
         # Calculate test coverage ratio
-        test_ratio = 0.0
-        if evidence['tests_total'] > 0:
-            test_ratio = evidence['tests_passed'] / evidence['tests_total']
+        test_ratio = evidence['tests_passed'] / tests_total if tests_total > 0 else 0.0
         
         # Calculate claims match ratio
-        claims_ratio = 0.0
-        if evidence['claims_total'] > 0:
-            claims_ratio = evidence['claims_matched'] / evidence['claims_total']
+        claims_ratio = evidence['claims_matched'] / claims_total if claims_total > 0 else 0.0
         
         # Weighted score
         score = (
-            claims_ratio * weights['claims_matched'] +
-            evidence['code_quality_score'] * weights['code_quality_score'] +
-            test_ratio * weights['test_coverage'] +
-            evidence.get('documentation_score', 0.5) * weights['documentation_score']
+            claims_ratio * CLAIMS_WEIGHT +
+            evidence['code_quality_score'] * QUALITY_WEIGHT +
+            test_ratio * TESTS_WEIGHT +
+            evidence.get('documentation_score', 0.5) * DOCUMENTATION_WEIGHT
         )
         
         # Penalty for critical issues
-        critical_issues = len([i for i in issues if 'false_claim' in str(i)])
-        score -= (critical_issues * 0.2)
+        score -= false_claims * FALSE_CLAIM_PENALTY
         
         return max(0.0, min(1.0, score))
     
@@ -434,26 +753,29 @@ class LLMOutputValidator:
             status = "❌ INVALID"
             emoji = "⚠️"
         
-        report = []
-        report.append(f"{emoji} AVAAD Agent Output Validation Report")
-        report.append("=" * 50)
-        report.append(f"Status: {status}")
-        report.append(f"Validation Score: {result.score:.1%}")
-        report.append(f"Claims Verified: {result.evidence['claims_matched']}/{result.evidence['claims_total']}")
-        report.append(f"Tests: {result.evidence['tests_passed']}/{result.evidence['tests_total']} passed")
-        report.append(f"Code Quality: {result.evidence['code_quality_score']:.1%}")
+        evidence = result.evidence
+        
+        report = io.StringIO()
+        write = report.write
+        write(f"{emoji} AVAAD Agent Output Validation Report\n")
+        write("=" * 50)
+        write(f"\nStatus: {status}")
+        write(f"\nValidation Score: {result.score:.1%}")
+        write(f"\nClaims Verified: {evidence['claims_matched']}/{evidence['claims_total']}")
+        write(f"\nTests: {evidence['tests_passed']}/{evidence['tests_total']} passed")
+        write(f"\nCode Quality: {evidence['code_quality_score']:.1%}")
         
         if result.issues:
-            report.append("\n🚨 Issues Found:")
+            write("\n\n🚨 Issues Found:")
             for issue in result.issues:
-                report.append(f"  • {issue}")
+                write(f"\n  • {issue}")
         
         if result.recommendations:
-            report.append("\n💡 Recommendations:")
+            write("\n\n💡 Recommendations:")
             for rec in result.recommendations:
-                report.append(f"  • {rec}")
+                write(f"\n  • {rec}")
         
-        return "\n".join(report)
+        return report.getvalue()
 
 
 def main():
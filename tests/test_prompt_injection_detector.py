@@ -0,0 +1,32 @@
+"""Tests for the code injection checks of the prompt injection detector."""
+
+import sys
+from pathlib import Path
+
+# The package root makes the shared `core` modules importable
+PACKAGE_ROOT = str(Path(__file__).resolve().parent.parent)
+if PACKAGE_ROOT not in sys.path:
+    sys.path.insert(0, PACKAGE_ROOT)
+
+from core.security.prompt_injection_detector import PromptInjectionDetector
+
+
+def _code_alert_titles(text: str) -> list[str]:
+    detector = PromptInjectionDetector()
+    return [alert.title for alert in detector._check_code_injection(text)]
+
+
+def test_overlapping_patterns_are_all_reported():
+    # "import subprocess" and "subprocess.run" overlap; both must alert
+    assert _code_alert_titles("import subprocess.run") == [
+        "Potential OS Module Import",
+        "Potential System Command",
+    ]
+
+
+def test_each_pattern_is_reported_once():
+    assert _code_alert_titles("eval(x); eval(y)") == ["Potential Code Execution"]
+
+
+def test_clean_text_raises_no_code_alerts():
+    assert _code_alert_titles("Refactored the connector and added tests") == []
@@ -6,9 +6,9 @@ Command-line interface for AI cost tracking, reporting, and budget management.
 """
 
 import sys
+import heapq
 import argparse
 from pathlib import Path
-import json
 
 # Add core modules to path
 sys.path.append(str(Path(__file__).parent / ".." / "core"))
@@ -118,7 +118,7 @@ def handle_report(tracker: CostTracker, args) -> int:
     
     if summary['by_story']:
         print("\n📋 Top Stories by Cost:")
-        for story, cost in sorted(summary['by_story'].items(), key=lambda x: x[1], reverse=True)[:5]:
+        for story, cost in heapq.nlargest(5, summary['by_story'].items(), key=lambda x: x[1]):
             print(f"  {story}: ${cost:.2f}")
     
     if summary['daily_breakdown']:
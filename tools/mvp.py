@@ -3,114 +3,229 @@
 AVAAD MVP: Comprehensive story validation with AI security and cost tracking
 """
 
+import asyncio
+import contextlib
+import io
 import sys
 import os
+from functools import lru_cache
 from pathlib import Path
 
-# Import validators
-try:
-    from practical_validator import validate_story_practical
-    from core.validators.llm_output_validator import LLMOutputValidator
-    from core.cost_tracker import CostTracker
-    from core.security.prompt_injection_detector import PromptInjectionDetector
-except ImportError:
-    sys.path.append(str(Path(__file__).parent))
-    sys.path.append(str(Path(__file__).parent / "core" / "validators"))
-    sys.path.append(str(Path(__file__).parent / "core" / "security"))
-    from practical_validator import validate_story_practical
+# The package root makes the shared `core` modules importable
+PACKAGE_ROOT = str(Path(__file__).resolve().parent.parent)
+if PACKAGE_ROOT not in sys.path:
+    sys.path.insert(0, PACKAGE_ROOT)
+
+from practical_validator import cancel_running_checks, reset_cancelled_checks, validate_story_practical
+
+# AI validation stages, imported by _load_comprehensive_stages when needed
+LLMOutputValidator = None
+CostTracker = None
+PromptInjectionDetector = None
+
+
+def _load_comprehensive_stages() -> None:
+    """
+    Import the validators used only by comprehensive mode.
+    
+    Deferred to here so quick mode skips their import cost. Called before
+    the stages start, so the concurrently running stages never race on a
+    first import.
+    """
+    global LLMOutputValidator, CostTracker, PromptInjectionDetector
     from core.validators.llm_output_validator import LLMOutputValidator
     from core.cost_tracker import CostTracker
     from core.security.prompt_injection_detector import PromptInjectionDetector
 
 
-def check_story(story_id: str, comprehensive: bool = False) -> bool:
-    """Comprehensive story validation with AI security and cost tracking."""
+# Cost log read by CostTracker.calculate_roi
+COST_LOG = Path("logs") / "ai_costs.jsonl"
+
+
+@lru_cache(maxsize=128)
+def _cached_roi(story_id: str, log_mtime_ns: int, log_size: int) -> dict:
+    """ROI for a story; cached per cost-log version so re-checks skip the log scan."""
+    return CostTracker().calculate_roi(story_id)
+
+
+def _calculate_roi(story_id: str) -> dict:
+    """Return the story's ROI, recomputed only when the cost log has changed."""
+    try:
+        stat = COST_LOG.stat()
+        version = (stat.st_mtime_ns, stat.st_size)
+    except FileNotFoundError:
+        version = (0, -1)
+    return _cached_roi(story_id, *version)
+
+
+def _check_agent_claims(story_id: str, validator: "LLMOutputValidator") -> tuple[bool, list[str]]:
+    """Stage 2: validate the AI agent's claims against the implementation."""
+    lines = ["🤖 2. Validating AI agent claims..."]
+    
+    # Look for agent output file
+    output_file = Path(f"logs/story-{story_id}-agent-output.txt")
+    try:
+        with open(output_file, 'r') as f:
+            agent_output = f.read()
+    except FileNotFoundError:
+        lines.append("   ⚠️  No agent output found for validation")
+        return True, lines
+    
+    validation = validator.validate_agent_output(
+        story_id, 
+        agent_output, 
+        files_changed=[]  # Would need to be populated
+    )
+    
+    lines.append(f"   AI Validation Score: {validation.score:.1%}")
+    if not validation.is_valid:
+        lines.append("   ❌ AI agent claims validation failed:")
+        for issue in validation.issues[:3]:  # Show first 3 issues
+            lines.append(f"     • {issue}")
+        return False, lines
+    lines.append("   ✅ AI claims validated")
+    return True, lines
+
+
+def _check_security(story_id: str) -> tuple[bool, list[str]]:
+    """Stage 3: scan the agent interactions for security issues."""
+    lines = ["🛡️  3. Checking for security issues..."]
+    detector = PromptInjectionDetector()
+    
+    # Check agent interactions
+    interaction_file = Path(f"logs/story-{story_id}-interactions.json")
+    if not interaction_file.exists():
+        lines.append("   ⚠️  No agent interactions found for security check")
+        return True, lines
     
-    print(f"🔍 AVAAD Comprehensive Validation for Story {story_id}")
-    print("=" * 60)
+    alerts = detector.scan_agent_interactions(str(interaction_file))
+    
+    high_alerts = [a for a in alerts if a.level in ['HIGH', 'CRITICAL']]
+    if high_alerts:
+        lines.append("   ❌ Security issues detected:")
+        for alert in high_alerts:
+            lines.append(f"     • {alert.title}: {alert.description}")
+        return False, lines
+    lines.append("   ✅ No security issues detected")
+    return True, lines
+
+
+def _check_cost(story_id: str) -> tuple[bool, list[str]]:
+    """Stage 4: check the AI cost and ROI of the story."""
+    lines = ["💰 4. Checking cost impact..."]
+    roi = _calculate_roi(story_id)
+    
+    if roi['total_cost'] > 0:
+        lines.append(f"   AI Cost: ${roi['total_cost']:.2f}")
+        lines.append(f"   ROI: {roi['roi_score']:.1f}%")
+        
+        if roi['roi_score'] < 0:
+            lines.append("   ❌ Negative ROI - consider optimizing AI usage")
+            return False, lines
+        lines.append("   ✅ Cost-effective AI usage")
+    return True, lines
+
+
+async def check_story_async(story_id: str, comprehensive: bool = False) -> bool:
+    """
+    Comprehensive story validation with AI security and cost tracking.
+    
+    The stages read independent inputs, so they run concurrently in worker
+    threads; their output is still reported in stage order and the first
+    failing stage decides the result. Once any stage fails, practical checks
+    and agent claim checks still running are stopped. The story's report is buffered and written
+    to stdout in one go.
+    """
+    
+    report = io.StringIO()
+    write = report.write
+    write(f"🔍 AVAAD Comprehensive Validation for Story {story_id}\n")
+    write("=" * 60 + "\n")
     
     try:
-        # 1. Traditional practical validation
-        print("📋 1. Checking practical functionality...")
-        is_practical_valid, practical_message = validate_story_practical(story_id)
+        claims_validator = None
+        if comprehensive:
+            _load_comprehensive_stages()
+            claims_validator = LLMOutputValidator()
         
-        if not is_practical_valid:
-            print(f"❌ Practical validation failed: {practical_message}")
-            return False
+        # Cleared here rather than in the stage, so a cancel issued by an
+        # early failure can't be undone by a stage that starts later
+        reset_cancelled_checks()
         
-        print("✅ Practical validation passed")
+        # 1. Traditional practical validation
+        write("📋 1. Checking practical functionality...\n")
+        stages = [asyncio.to_thread(validate_story_practical, story_id)]
         
-        # 2. LLM Output Validation (if comprehensive mode)
+        # 2-4. LLM output validation, security and cost checks (if comprehensive mode)
         if comprehensive:
-            print("🤖 2. Validating AI agent claims...")
-            validator = LLMOutputValidator()
-            
-            # Look for agent output file
-            output_file = Path(f"logs/story-{story_id}-agent-output.txt")
-            if output_file.exists():
-                with open(output_file, 'r') as f:
-                    agent_output = f.read()
-                
-                validation = validator.validate_agent_output(
-                    story_id, 
-                    agent_output, 
-                    files_changed=[]  # Would need to be populated
-                )
-                
-                print(f"   AI Validation Score: {validation.score:.1%}")
-                if not validation.is_valid:
-                    print("   ❌ AI agent claims validation failed:")
-                    for issue in validation.issues[:3]:  # Show first 3 issues
-                        print(f"     • {issue}")
-                    return False
-                print("   ✅ AI claims validated")
-            else:
-                print("   ⚠️  No agent output found for validation")
+            stages += [
+                asyncio.to_thread(_check_agent_claims, story_id, claims_validator),
+                asyncio.to_thread(_check_security, story_id),
+                asyncio.to_thread(_check_cost, story_id),
+            ]
         
-        # 3. Security check
-        if comprehensive:
-            print("🛡️  3. Checking for security issues...")
-            detector = PromptInjectionDetector()
-            
-            # Check agent interactions
-            interaction_file = Path(f"logs/story-{story_id}-interactions.json")
-            if interaction_file.exists():
-                alerts = detector.scan_agent_interactions(str(interaction_file))
-                
-                high_alerts = [a for a in alerts if a.level in ['HIGH', 'CRITICAL']]
-                if high_alerts:
-                    print("   ❌ Security issues detected:")
-                    for alert in high_alerts:
-                        print(f"     • {alert.title}: {alert.description}")
-                    return False
-                print("   ✅ No security issues detected")
-            else:
-                print("   ⚠️  No agent interactions found for security check")
+        tasks = [asyncio.ensure_future(stage) for stage in stages]
+        interrupted = set()
         
-        # 4. Cost tracking
-        if comprehensive:
-            print("💰 4. Checking cost impact...")
-            tracker = CostTracker()
-            roi = tracker.calculate_roi(story_id)
-            
-            if roi['total_cost'] > 0:
-                print(f"   AI Cost: ${roi['total_cost']:.2f}")
-                print(f"   ROI: {roi['roi_score']:.1f}%")
-                
-                if roi['roi_score'] < 0:
-                    print("   ❌ Negative ROI - consider optimizing AI usage")
-                    return False
-                print("   ✅ Cost-effective AI usage")
+        # Practical validation prints its progress; only that stage prints,
+        # so capturing stdout keeps its output in place in the report
+        with contextlib.redirect_stdout(report):
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                if pending and any(not task.result()[0] for task in done):
+                    # The story has already failed: kill the practical and agent
+                    # claim checks' subprocesses so the stages still running
+                    # finish quickly
+                    interrupted = pending
+                    cancel_running_checks()
+                    if claims_validator is not None:
+                        claims_validator.cancel()
+                    await asyncio.wait(pending)
+                    for task in pending:
+                        task.exception()  # An error from a stage cut short proves nothing
+                    break
+        
+        practical, *stage_tasks = tasks
+        is_practical_valid, practical_message = practical.result()
+        if practical in interrupted:
+            write("⏹️  Practical validation stopped: a later check already failed\n")
+        elif not is_practical_valid:
+            write(f"❌ Practical validation failed: {practical_message}\n")
+            return False
+        else:
+            write("✅ Practical validation passed\n")
+        
+        for task in stage_tasks:
+            if task in interrupted and task is stage_tasks[0]:
+                # Agent claim checks cut short report errors that prove nothing
+                write("🤖 2. Validating AI agent claims...\n")
+                write("   ⏹️  Stopped: a later check already failed\n")
+                continue
+            passed, lines = task.result()
+            for line in lines:
+                write(line + "\n")
+            if not passed:
+                return False
         
         # Success!
-        print("\n🎉 Story validation complete!")
-        print("✅ All checks passed - story is ready for completion")
+        write("\n🎉 Story validation complete!\n")
+        write("✅ All checks passed - story is ready for completion\n")
         return True
         
     except Exception as e:
-        print(f"⚠️  ERROR: Validation failed - {str(e)}")
-        print("Run with --simple for basic validation only")
+        write(f"⚠️  ERROR: Validation failed - {str(e)}\n")
+        write("Run with --simple for basic validation only\n")
         return False
+    
+    finally:
+        sys.stdout.write(report.getvalue())
+        sys.stdout.flush()
+
+
+def check_story(story_id: str, comprehensive: bool = False) -> bool:
+    """Comprehensive story validation with AI security and cost tracking."""
+    return asyncio.run(check_story_async(story_id, comprehensive))
 
 
 def main():
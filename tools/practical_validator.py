@@ -3,26 +3,375 @@
 AVAAD Practical Validator - Tests what stories actually claim to deliver
 """
 
+import contextlib
+import hashlib
+import json
+import os
 import subprocess
+import sys
+import threading
 import time
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    import tomllib  # Optional: Python 3.11+, parses pyproject.toml
+except ImportError:
+    tomllib = None
 
-def validate_story_practical(story_id: str) -> tuple[bool, str]:
-    """Practical validation that tests what the story actually claims."""
+try:
+    from core._config_cache import load_yaml
+except ImportError:
+    sys.path.append(str(Path(__file__).parent.parent / "core"))
+    from _config_cache import load_yaml
+
+
+# Persistent cache of practical validation passes. Each entry is keyed by
+# story and a fingerprint of the files its check depends on, so a pass is
+# reused until one of those files changes.
+CACHE_FILE = Path(".avaad-cache") / "practical-validator.json"
+CACHE_SIZE = 32  # Most recent results kept
+
+# Dependency and configuration files that change what pytest, ruff and mypy
+# report, part of the inputs of every story check that runs them
+TOOL_INPUTS = (
+    "pyproject.toml", "poetry.lock", "setup.cfg", "tox.ini", "pytest.ini", "conftest.py",
+    "ruff.toml", ".ruff.toml", "mypy.ini", ".mypy.ini",
+)
+
+# Files and directories each story's check depends on; story 1.1's come
+# from docker-compose.yml, see _compose_inputs
+STORY_INPUTS = {
+    "1.4": (*TOOL_INPUTS, "apps/api/src", "tests"),
+    "1.1.5": (*TOOL_INPUTS, "apps/api/src"),
+    "6.1": (*TOOL_INPUTS, "apps/api/src", "packages/db"),
+    "6.2": (*TOOL_INPUTS, "apps/api/src", "packages/db"),
+}
+
+# Names skipped when fingerprinting directories: bytecode caches, and the
+# logs mvp's stages write on every run (reached through a build context of ".")
+FINGERPRINT_SKIP = ("__pycache__", "logs")
+
+# Environment variables that change what the story checks do
+CACHE_ENV = ("AVAAD_FULL_CONTAINER_TEST", "AVAAD_MYPY_FULL_RUN")
+
+# Text markers searched for by validate_mypy_and_inventory; the strict
+# marker is only used when tomllib is unavailable
+MYPY_STRICT_MARKER = "strict = true"
+MYPY_ERROR_MARKER = ": error:"
+
+# Source root of the API application, importable for in-process checks
+API_SRC = "apps/api/src"
+
+# Files whose presence the story checks require
+DOCKER_COMPOSE_FILE = Path("docker-compose.yml")
+DATABENTO_CONNECTOR_FILE = Path(API_SRC) / "services" / "connectors" / "databento_connector.py"
+LOGGING_MODULE_FILE = Path(API_SRC) / "core" / "logging.py"
+
+# Results loaded from CACHE_FILE, on first use
+_cache = None
+
+# Subprocesses of running checks, killed by cancel_running_checks
+_running: set[subprocess.Popen] = set()
+_running_lock = threading.Lock()
+_cancelled = threading.Event()
+
+
+def validate_story_practical(story_id: str, use_cache: bool = True) -> tuple[bool, str]:
+    """
+    Practical validation that tests what the story actually claims.
+    
+    Passes are cached per story and input fingerprint; pass use_cache=False
+    to force the checks to run. Failures are always re-checked, since they
+    may come from the environment (Docker down, a timeout, a cancelled
+    check) rather than the story's files.
+    """
     
     print(f"🔍 Practical validation for Story {story_id}")
     
-    if story_id == "1.1":
-        return validate_containerization()
-    elif story_id == "1.4":
-        return validate_databento_connector()
-    elif story_id == "1.1.5":
-        return validate_structured_logging()
-    elif story_id in ["6.1", "6.2"]:
-        return validate_mypy_and_inventory()
-    else:
+    inputs = _story_inputs(story_id) if use_cache else None
+    if inputs is None:
+        return run_story_validation(story_id)
+    
+    cache = _load_cache()
+    key = f"{story_id}:{_fingerprint(inputs)}"
+    if key in cache:
+        print("♻️  Inputs unchanged since the last run, reusing its result")
+        is_valid, message = cache[key]
+        return is_valid, message
+    
+    result = run_story_validation(story_id)
+    if result[0]:
+        cache[key] = list(result)
+        _save_cache(cache)
+    return result
+
+
+def cancel_running_checks() -> None:
+    """
+    Stop the practical checks in progress, e.g. once another stage has failed.
+    
+    Their subprocesses are killed and the interrupted check fails quickly;
+    its result is not cached.
+    """
+    _cancelled.set()
+    with _running_lock:
+        for process in _running:
+            process.kill()
+
+
+def reset_cancelled_checks() -> None:
+    """
+    Let checks run again after cancel_running_checks.
+    
+    Call before starting a new validation, not from the thread running it,
+    so a cancel issued meanwhile isn't lost.
+    """
+    _cancelled.clear()
+
+
+@contextlib.contextmanager
+def _track(process: subprocess.Popen):
+    """Make a check's subprocess killable by cancel_running_checks while it runs."""
+    with _running_lock:
+        _running.add(process)
+        if _cancelled.is_set():
+            process.kill()
+    try:
+        yield process
+    finally:
+        with _running_lock:
+            _running.discard(process)
+        if _cancelled.is_set():
+            raise RuntimeError("check cancelled")
+
+
+def _run(command: list[str], timeout: float,
+         env: dict[str, str] | None = None) -> subprocess.CompletedProcess:
+    """Like subprocess.run with captured text output, but cancellable."""
+    with subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                          text=True, env=env) as process, _track(process):
+        try:
+            stdout, stderr = process.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.communicate()
+            raise
+    return subprocess.CompletedProcess(command, process.returncode, stdout, stderr)
+
+
+def run_story_validation(story_id: str) -> tuple[bool, str]:
+    """Run the practical checks for a story, bypassing the result cache."""
+    validator = STORY_VALIDATORS.get(story_id)
+    if validator is None:
         return False, f"Validation not implemented for story {story_id}"
+    return validator()
+
+
+def _story_inputs(story_id: str) -> tuple[str, ...] | None:
+    """Return the files a story's check depends on, or None if its result can't be cached."""
+    if story_id == "1.1":
+        return _compose_inputs()
+    return STORY_INPUTS.get(story_id)
+
+
+def _compose_inputs() -> tuple[str, ...] | None:
+    """
+    List the files the container check depends on.
+    
+    These are docker-compose.yml, .env, and each service's build context,
+    Dockerfile and env files. Returns None if the compose file can't be
+    parsed, so the result isn't cached.
+    """
+    try:
+        compose = load_yaml(str(DOCKER_COMPOSE_FILE))
+    except FileNotFoundError:
+        return (str(DOCKER_COMPOSE_FILE),)
+    except Exception:
+        return None
+    
+    inputs = [str(DOCKER_COMPOSE_FILE), ".env"]
+    services = compose.get("services") if isinstance(compose, dict) else None
+    for service in (services or {}).values():
+        if not isinstance(service, dict):
+            continue
+        
+        build = service.get("build")
+        if isinstance(build, str):
+            build = {"context": build}
+        if isinstance(build, dict):
+            context = build.get("context", ".")
+            inputs.append(context)
+            if build.get("dockerfile"):
+                inputs.append(os.path.join(context, build["dockerfile"]))
+        
+        env_files = service.get("env_file") or []
+        if isinstance(env_files, str):
+            env_files = [env_files]
+        for env_file in env_files:
+            path = env_file.get("path") if isinstance(env_file, dict) else env_file
+            if isinstance(path, str):
+                inputs.append(path)
+    
+    return tuple(dict.fromkeys(os.path.normpath(path) for path in inputs))
+
+
+def _fingerprint(paths: tuple[str, ...]) -> str:
+    """Hash the path, size and mtime of every file under the given paths."""
+    digest = hashlib.blake2b(digest_size=16)
+    for name in CACHE_ENV:
+        digest.update(f"{name}={os.environ.get(name, '')}\n".encode())
+    
+    def add_file(path: str, stat: os.stat_result) -> None:
+        digest.update(f"{path}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+    
+    for root in paths:
+        try:
+            stat = os.stat(root)
+        except OSError:
+            digest.update(f"{root}\0missing\n".encode())
+            continue
+        if not os.path.isdir(root):
+            add_file(root, stat)
+            continue
+        
+        # Symlinked directories below the root aren't followed, so a link
+        # back to an ancestor can't loop the walk
+        pending = [root]
+        while pending:
+            try:
+                entries = sorted(os.scandir(pending.pop()), key=lambda e: e.name)
+            except OSError:
+                continue
+            for entry in entries:
+                # Skip hidden entries and what tools and stages rewrite on every run
+                if entry.name.startswith('.') or entry.name in FINGERPRINT_SKIP:
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                    continue
+                try:
+                    add_file(entry.path, entry.stat())
+                except OSError:
+                    digest.update(f"{entry.path}\0missing\n".encode())
+    
+    return digest.hexdigest()
+
+
+def _load_cache() -> dict:
+    """Load the result cache from disk once per process."""
+    global _cache
+    if _cache is None:
+        try:
+            with open(CACHE_FILE, 'r') as f:
+                _cache = json.load(f)
+        except (OSError, ValueError):
+            _cache = {}
+    return _cache
+
+
+def _save_cache(cache: dict) -> None:
+    """Write the most recent CACHE_SIZE results back to disk."""
+    while len(cache) > CACHE_SIZE:
+        del cache[next(iter(cache))]
+    try:
+        CACHE_FILE.parent.mkdir(exist_ok=True)
+        with open(CACHE_FILE, 'w') as f:
+            json.dump(cache, f, indent=2)
+    except OSError:
+        pass
+
+
+@lru_cache(maxsize=None)
+def _venv_python() -> str | None:
+    """Return the Poetry environment's interpreter, or None if it can't be found."""
+    try:
+        result = subprocess.run(
+            ["poetry", "env", "info", "--path"],
+            capture_output=True, text=True, timeout=30
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    
+    if result.returncode != 0 or not result.stdout.strip():
+        return None
+    
+    bin_dir = "Scripts" if os.name == "nt" else "bin"
+    python = Path(result.stdout.strip()) / bin_dir / ("python.exe" if os.name == "nt" else "python")
+    return str(python) if python.exists() else None
+
+
+def _tool_command(tool: str, *args: str) -> list[str]:
+    """
+    Build the command line for a dev tool installed in the project environment.
+    
+    Runs the tool as a module of the environment's interpreter, which skips
+    the environment resolution `poetry run` repeats on every call; falls
+    back to `poetry run` when the environment can't be located.
+    """
+    python = _venv_python()
+    if python is None:
+        return ["poetry", "run", tool, *args]
+    return [python, "-m", tool, *args]
+
+
+def _run_in_app(code: str) -> subprocess.CompletedProcess:
+    """
+    Run Python code in a child interpreter with API_SRC on its PYTHONPATH.
+    
+    The app's top-level packages (e.g. `core`) share names with the
+    framework's, so they are imported in a separate process rather than
+    here. The child stays in the project root, as the app does when run,
+    and PYTHONSAFEPATH keeps the root itself off its sys.path (Python
+    3.11+). The current interpreter is used directly, skipping `poetry run`.
+    """
+    env = dict(os.environ, PYTHONSAFEPATH="1")
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, (os.path.abspath(API_SRC), os.environ.get("PYTHONPATH")))
+    )
+    return _run([sys.executable, "-c", code], timeout=10, env=env)
+
+
+@lru_cache(maxsize=4)
+def _parse_pyproject(path: str, mtime_ns: int) -> dict:
+    """Parse a pyproject.toml; cached per (path, mtime) so edits are picked up."""
+    with open(path, "rb") as f:
+        return tomllib.load(f)
+
+
+def load_pyproject(path: str = "pyproject.toml") -> dict:
+    """
+    Load pyproject.toml, parsing it once per process until it changes.
+    
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    path = os.path.abspath(path)
+    return _parse_pyproject(path, os.stat(path).st_mtime_ns)
+
+
+def _mypy_strict_enabled() -> bool:
+    """Return True if pyproject.toml turns on mypy strict mode."""
+    if tomllib is None:
+        with open("pyproject.toml", "r") as f:
+            return MYPY_STRICT_MARKER in f.read()
+    return load_pyproject().get("tool", {}).get("mypy", {}).get("strict") is True
+
+
+def _has_test_for(root: str, keyword: str) -> bool:
+    """Return True as soon as an entry named test*<keyword>* is found under root."""
+    pending = [root]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.name.startswith('test') and keyword in entry.name[4:]:
+                        return True
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+        except OSError:
+            continue
+    return False
 
 
 def validate_containerization() -> tuple[bool, str]:
@@ -32,31 +381,38 @@ def validate_containerization() -> tuple[bool, str]:
     
     try:
         # Check if docker-compose.yml exists
-        if not Path("docker-compose.yml").exists():
+        if not DOCKER_COMPOSE_FILE.exists():
             return False, "docker-compose.yml missing"
         
         # Try to validate docker-compose config
-        result = subprocess.run(
-            ["docker-compose", "config"],
-            capture_output=True, text=True, timeout=30
-        )
+        result = _run(["docker-compose", "config", "--quiet"], timeout=30)
         
         if result.returncode != 0:
             return False, f"docker-compose config invalid: {result.stderr}"
         
-        # Try to start services (but don't leave them running)
-        print("🚀 Testing if containers can start...")
-        start_result = subprocess.run(
-            ["docker-compose", "up", "-d", "--no-deps", "api"],
-            capture_output=True, text=True, timeout=60
-        )
+        if os.environ.get("AVAAD_FULL_CONTAINER_TEST") == "1":
+            # Try to start services (but don't leave them running)
+            print("🚀 Testing if containers can start...")
+            start_result = _run(["docker-compose", "up", "-d", "--no-deps", "api"], timeout=60)
+            
+            if start_result.returncode == 0:
+                # Clean up
+                subprocess.run(["docker-compose", "down"], capture_output=True, timeout=30)
+                return True, "Containers can start successfully"
+            else:
+                return False, f"Containers failed to start: {start_result.stderr}"
         
-        if start_result.returncode == 0:
+        # Creating the container resolves the image and the service config
+        # without the cost of starting it; AVAAD_FULL_CONTAINER_TEST=1 starts it too
+        print("🚀 Testing if containers can be created...")
+        create_result = _run(["docker-compose", "create", "--no-recreate", "api"], timeout=60)
+        
+        if create_result.returncode == 0:
             # Clean up
-            subprocess.run(["docker-compose", "down"], capture_output=True, timeout=30)
-            return True, "Containers can start successfully"
+            subprocess.run(["docker-compose", "rm", "-f", "api"], capture_output=True, timeout=30)
+            return True, "Containers can be created successfully"
         else:
-            return False, f"Containers failed to start: {start_result.stderr}"
+            return False, f"Containers failed to create: {create_result.stderr}"
             
     except subprocess.TimeoutExpired:
         return False, "Container startup timed out"
@@ -71,30 +427,23 @@ def validate_databento_connector() -> tuple[bool, str]:
     
     try:
         # Check if connector file exists
-        connector_file = Path("apps/api/src/services/connectors/databento_connector.py")
-        if not connector_file.exists():
+        if not DATABENTO_CONNECTOR_FILE.exists():
             return False, "DataBento connector file missing"
         
         # Try to import the connector
-        import_test = subprocess.run([
-            "python", "-c", 
-            "import sys; sys.path.append('apps/api/src'); "
-            "from services.connectors.databento_connector import DataBentoConnector; "
-            "print('Import successful')"
-        ], capture_output=True, text=True, timeout=10)
+        import_test = _run_in_app(
+            "from services.connectors.databento_connector import DataBentoConnector"
+        )
         
         if import_test.returncode != 0:
             return False, f"Connector import failed: {import_test.stderr}"
         
         # Check if tests exist for the connector
-        test_files = list(Path("tests").glob("**/test*databento*"))
-        if not test_files:
+        if not _has_test_for("tests", "databento"):
             return False, "No tests found for DataBento connector"
         
         # Run connector-specific tests
-        test_result = subprocess.run([
-            "poetry", "run", "pytest", "-v", "-k", "databento", "--tb=short"
-        ], capture_output=True, text=True, timeout=60)
+        test_result = _run(_tool_command("pytest", "-v", "-k", "databento", "--tb=short"), timeout=60)
         
         if test_result.returncode == 0:
             return True, "DataBento connector tests pass"
@@ -112,27 +461,21 @@ def validate_structured_logging() -> tuple[bool, str]:
     
     try:
         # Check if logging module exists
-        logging_file = Path("apps/api/src/core/logging.py")
-        if not logging_file.exists():
+        if not LOGGING_MODULE_FILE.exists():
             return False, "Logging module missing"
         
         # Try to import and use logging
-        logging_test = subprocess.run([
-            "python", "-c",
-            "import sys; sys.path.append('apps/api/src'); "
+        logging_test = _run_in_app(
             "from core.logging import get_logger; "
             "logger = get_logger('test'); "
-            "logger.info('Test message'); "
-            "print('Logging works')"
-        ], capture_output=True, text=True, timeout=10)
+            "logger.info('Test message')"
+        )
         
         if logging_test.returncode != 0:
             return False, f"Logging import/usage failed: {logging_test.stderr}"
         
         # Check if pre-commit/linting passes (required for story completion)
-        lint_result = subprocess.run([
-            "poetry", "run", "ruff", "check", "apps/api/src/core/logging.py"
-        ], capture_output=True, text=True, timeout=30)
+        lint_result = _run(_tool_command("ruff", "check", str(LOGGING_MODULE_FILE)), timeout=30)
         
         if lint_result.returncode == 0:
             return True, "Structured logging works and passes linting"
@@ -143,6 +486,45 @@ def validate_structured_logging() -> tuple[bool, str]:
         return False, f"Structured logging validation failed: {e}"
 
 
+def _count_mypy_errors(command: list[str], timeout: float, fail_fast: bool) -> int:
+    """
+    Run mypy and count the error lines it prints.
+    
+    Output is read as mypy produces it; with fail_fast the run is stopped at
+    the first error, so broken code fails in seconds rather than after a
+    full check.
+    
+    Raises:
+        subprocess.TimeoutExpired: If mypy runs longer than timeout seconds
+    """
+    # Unbuffered, so errors arrive as mypy reports them rather than at exit
+    env = {**os.environ, "PYTHONUNBUFFERED": "1"}
+    timed_out = threading.Event()
+    
+    def kill() -> None:
+        timed_out.set()
+        process.kill()
+    
+    error_count = 0
+    with subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                          text=True, env=env) as process, _track(process):
+        timer = threading.Timer(timeout, kill)
+        timer.start()
+        try:
+            for line in process.stdout:
+                if MYPY_ERROR_MARKER in line:
+                    error_count += 1
+                    if fail_fast:
+                        process.terminate()
+                        break
+        finally:
+            timer.cancel()
+    
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(command, timeout)
+    return error_count
+
+
 def validate_mypy_and_inventory() -> tuple[bool, str]:
     """Stories 6.1/6.2: Check if MyPy strict mode actually works."""
     
@@ -150,20 +532,21 @@ def validate_mypy_and_inventory() -> tuple[bool, str]:
     
     try:
         # Check pyproject.toml has strict = true
-        with open("pyproject.toml", "r") as f:
-            content = f.read()
-            if "strict = true" not in content:
-                return False, "MyPy strict mode not enabled in pyproject.toml"
-        
-        # Run MyPy and check for errors
-        mypy_result = subprocess.run([
-            "poetry", "run", "mypy", "--strict", "apps/api/src", "packages/db"
-        ], capture_output=True, text=True, timeout=120)
+        if not _mypy_strict_enabled():
+            return False, "MyPy strict mode not enabled in pyproject.toml"
         
-        error_count = mypy_result.stdout.count(": error:")
+        # Run MyPy and check for errors, stopping at the first one unless
+        # AVAAD_MYPY_FULL_RUN=1 asks for the full count
+        fail_fast = os.environ.get("AVAAD_MYPY_FULL_RUN") != "1"
+        error_count = _count_mypy_errors(
+            _tool_command("mypy", "--strict", "apps/api/src", "packages/db"),
+            timeout=120, fail_fast=fail_fast
+        )
         
         if error_count == 0:
             return True, "MyPy strict mode enabled with 0 errors"
+        elif fail_fast:
+            return False, "MyPy has errors in strict mode (stopped at the first one)"
         else:
             return False, f"MyPy has {error_count} errors in strict mode"
             
@@ -171,6 +554,16 @@ def validate_mypy_and_inventory() -> tuple[bool, str]:
         return False, f"MyPy validation failed: {e}"
 
 
+# Practical validator for each story
+STORY_VALIDATORS = {
+    "1.1": validate_containerization,
+    "1.4": validate_databento_connector,
+    "1.1.5": validate_structured_logging,
+    "6.1": validate_mypy_and_inventory,
+    "6.2": validate_mypy_and_inventory,
+}
+
+
 def main():
     """Test the practical validator."""
     if len(sys.argv) != 2:
@@ -189,5 +582,4 @@ def main():
 
 
 if __name__ == "__main__":
-    import sys
     main()
\ No newline at end of file
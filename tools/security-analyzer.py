@@ -8,13 +8,21 @@ agent behavior monitoring, and security reporting.
 
 import sys
 import argparse
+from collections import Counter
 from pathlib import Path
 import json
 
 # Add core modules to path
 sys.path.append(str(Path(__file__).parent / ".." / "core" / "security"))
 
-from prompt_injection_detector import PromptInjectionDetector, SecurityAlert
+from prompt_injection_detector import HIGH_SEVERITY_LEVELS, PromptInjectionDetector, SecurityAlert
+
+# Interaction logs scanned by the report command
+REPORT_LOG_FILES = (
+    Path("logs/agent-claims.jsonl"),
+    Path("logs/agent-interactions.json"),
+    Path("logs/ai_interactions.json")
+)
 
 
 def main():
@@ -40,7 +48,7 @@ Examples:
     
     # Scan file command
     scan_file_parser = subparsers.add_parser('scan-file', help='Scan file for security issues')
-    scan_file_parser.add_argument('file', help='File containing agent interactions (JSON)')
+    scan_file_parser.add_argument('file', help='File containing agent interactions (JSON Lines or JSON array)')
     
     # Scan story command
     scan_story_parser = subparsers.add_parser('scan-story', help='Scan specific story for security issues')
@@ -77,6 +85,11 @@ Examples:
     return 0
 
 
+def exit_code(alerts: list[SecurityAlert]) -> int:
+    """Return 1 if any alert is HIGH or CRITICAL, stopping at the first one."""
+    return 1 if any(alert.level in HIGH_SEVERITY_LEVELS for alert in alerts) else 0
+
+
 def handle_scan_text(detector: PromptInjectionDetector, args) -> int:
     """Handle text scanning command."""
     print("🔍 Scanning text for security issues...")
@@ -91,8 +104,7 @@ def handle_scan_text(detector: PromptInjectionDetector, args) -> int:
     print(detector.generate_security_report(alerts))
     
     # Return non-zero if high/critical issues found
-    high_issues = [a for a in alerts if a.level in ['HIGH', 'CRITICAL']]
-    return 1 if high_issues else 0
+    return exit_code(alerts)
 
 
 def handle_scan_file(detector: PromptInjectionDetector, args) -> int:
@@ -113,8 +125,7 @@ def handle_scan_file(detector: PromptInjectionDetector, args) -> int:
     
     print(detector.generate_security_report(alerts))
     
-    high_issues = [a for a in alerts if a.level in ['HIGH', 'CRITICAL']]
-    return 1 if high_issues else 0
+    return exit_code(alerts)
 
 
 def handle_scan_story(detector: PromptInjectionDetector, args) -> int:
@@ -154,8 +165,7 @@ def handle_scan_story(detector: PromptInjectionDetector, args) -> int:
     
     print(detector.generate_security_report(alerts))
     
-    high_issues = [a for a in alerts if a.level in ['HIGH', 'CRITICAL']]
-    return 1 if high_issues else 0
+    return exit_code(alerts)
 
 
 def handle_report(detector: PromptInjectionDetector, args) -> int:
@@ -163,20 +173,12 @@ def handle_report(detector: PromptInjectionDetector, args) -> int:
     print("📊 AVAAD Security Report")
     print("=" * 50)
     
-    # Look for interaction logs
-    log_files = [
-        "logs/agent-claims.jsonl",
-        "logs/agent-interactions.json",
-        "logs/ai_interactions.json"
-    ]
-    
+    # A missing log scans as empty, so there is no separate existence check.
+    # Scanning is CPU-bound pattern matching, so the logs are scanned one by
+    # one; the detector spreads a large log over worker processes itself.
     all_alerts = []
-    
-    for log_file in log_files:
-        log_path = Path(log_file)
-        if log_path.exists():
-            alerts = detector.scan_agent_interactions(str(log_path))
-            all_alerts.extend(alerts)
+    for log_file in REPORT_LOG_FILES:
+        all_alerts.extend(detector.scan_agent_interactions(str(log_file)))
     
     if not all_alerts:
         print("✅ No security issues detected in any logs!")
@@ -185,16 +187,13 @@ def handle_report(detector: PromptInjectionDetector, args) -> int:
     print(detector.generate_security_report(all_alerts))
     
     # Summary statistics
-    severity_counts = {}
-    for alert in all_alerts:
-        severity_counts[alert.level] = severity_counts.get(alert.level, 0) + 1
+    severity_counts = Counter(alert.level for alert in all_alerts)
     
     print("\n📈 Summary:")
-    for severity, count in severity_counts.items():
+    for severity, count in severity_counts.most_common():
         print(f"  {severity}: {count} issues")
     
-    high_issues = [a for a in all_alerts if a.level in ['HIGH', 'CRITICAL']]
-    return 1 if high_issues else 0
+    return exit_code(all_alerts)
 
 
 if __name__ == "__main__":
@@ -3,20 +3,294 @@
 AVAAD Validation Framework - Comprehensive Story Validators
 """
 
+import asyncio
+import contextvars
+import hashlib
+import os
+import shutil
 import subprocess
 import sys
 import json
+import threading
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Dict, List, Tuple, Any
+from typing import Awaitable, Callable, Dict, Iterator, List, Optional, Tuple, Any
 
+try:
+    import orjson  # Optional: faster parsing of coverage.json
+except ImportError:
+    orjson = None
 
+
+# Persistent cache of story validation passes, keyed by story and a
+# fingerprint of the repository state (HEAD plus uncommitted changes)
+CACHE_FILE = Path(".avaad-cache") / "validators.json"
+CACHE_SIZE = 32  # Most recent results kept
+
+# Set to 1 to run only the tests changed since the branch left BASE_BRANCH;
+# coverage then reflects those tests only, so it is off by default
+FAST_VALIDATE_ENV = "AVAAD_FAST_VALIDATE"
+BASE_BRANCH = "origin/main"
+
+# Files the validators write themselves, left out of the repository fingerprint
+FINGERPRINT_EXCLUDES = (".avaad-cache", "coverage.json")
+
+# Files that make up the monitoring stack
+MONITORING_FILES = (
+    "docker-compose.yml",
+    "monitoring/prometheus.yml",
+    "monitoring/grafana/",
+)
+
+# Marker of an error line in mypy's output
+MYPY_ERROR_MARKER = b": error:"
+
+# Linter run by the configuration linting check, in place of `make lint`;
+# the project's own type-checking settings aren't known here, so mypy is
+# left to the stories that check it explicitly
+LINT_COMMAND = ["poetry", "run", "ruff", "check", "--output-format=concise", "."]
+
+# Command validating each configuration file, run when the file exists
+CONFIG_FILE_CHECKS = {
+    "pyproject.toml": ["poetry", "check"],
+    "docker-compose.yml": ["docker-compose", "config"],
+    ".pre-commit-config.yaml": ["pre-commit", "validate-config"],
+}
+
+# Seconds allowed to each configuration validation command; the checks
+# sharing a command through _start_once must agree on its timeout
+CONFIG_CHECK_TIMEOUT = 30
+
+# Results loaded from CACHE_FILE, on first use
+_cache = None
+
+# Runs started through _start_once during the current validation, a task per
+# command; set by StoryValidator._run_checks and dropped when it returns
+_command_runs: contextvars.ContextVar[Optional[Dict[Tuple[Any, ...], asyncio.Task]]] = (
+    contextvars.ContextVar("_command_runs", default=None)
+)
+
+# Held while listing the project's files, so concurrent checks list them once
+_project_files_lock = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def _executable(name: str) -> str:
+    """
+    Resolve a tool to its absolute path once, so children don't search PATH.
+    
+    A tool that isn't found is returned as is and fails to start as before.
+    """
+    return shutil.which(name) or name
+
+
+async def _exec(
+    command: List[str], timeout: Optional[float] = None,
+    read_output: Optional[Callable[[asyncio.StreamReader], Awaitable[None]]] = None
+) -> int:
+    """
+    Run a command and return its exit code.
+    
+    Its output is discarded, or passed to read_output as it is written. The
+    process is killed if it outlives timeout seconds, reading its output
+    fails, or the run is cancelled.
+    
+    Raises:
+        subprocess.TimeoutExpired: If the command runs longer than timeout seconds
+    """
+    stdout = asyncio.subprocess.DEVNULL if read_output is None else asyncio.subprocess.PIPE
+    process = await asyncio.create_subprocess_exec(
+        _executable(command[0]), *command[1:],
+        stdout=stdout, stderr=asyncio.subprocess.DEVNULL
+    )
+    
+    async def run() -> int:
+        if read_output is not None:
+            await read_output(process.stdout)
+        return await process.wait()
+    
+    try:
+        return await asyncio.wait_for(run(), timeout)
+    except asyncio.TimeoutError:
+        raise subprocess.TimeoutExpired(command, timeout) from None
+    finally:
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
+
+
+def _start_once(command: List[str], timeout: Optional[float] = None) -> asyncio.Task:
+    """
+    Start a command whose output is unused, once per validation, and return its run.
+    
+    Several checks run the same command (e.g. pre-commit validate-config), so
+    a command already run, or still running for another check, isn't started
+    again when started with the same timeout. Runs are shared within one StoryValidator._run_checks call; the
+    next validation runs every command afresh, and outside a validation
+    nothing is shared. Must be called from a running event loop.
+    """
+    runs = _command_runs.get()
+    if runs is None:
+        runs = {}
+    key = (*command, timeout)
+    run = runs.get(key)
+    if run is None:
+        run = runs[key] = asyncio.ensure_future(_exec(command, timeout))
+        # Errors are re-raised to the checks awaiting the run; this marks
+        # them seen for runs no check waited for
+        run.add_done_callback(lambda run: run.cancelled() or run.exception())
+    return run
+
+
+async def _run_once(command: List[str], timeout: Optional[float] = None) -> int:
+    """
+    Return the exit code of a command run through _start_once.
+    
+    An error running the command is re-raised to each caller. Cancelling a
+    caller leaves the run going for the others.
+    """
+    return await asyncio.shield(_start_once(command, timeout))
+
+
+def _project_files() -> Optional[Tuple[str, ...]]:
+    """
+    List the project's files, tracked and untracked but not ignored, in one git call.
+    
+    The file checks filter this one listing instead of each walking the tree;
+    it is made afresh for each validation, see StoryValidator._run_checks.
+    Returns None outside a git checkout, in which case they walk it after all.
+    """
+    with _project_files_lock:
+        return _list_project_files()
+
+
+@lru_cache(maxsize=1)
+def _list_project_files() -> Optional[Tuple[str, ...]]:
+    """List the project's files with git ls-files; see _project_files."""
+    try:
+        result = subprocess.run(
+            ["git", "ls-files", "-z", "--cached", "--others", "--exclude-standard"],
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, timeout=30
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    if result.returncode != 0:
+        return None
+    return tuple(os.fsdecode(path) for path in result.stdout.split(b'\0') if path)
+
+
+def _walk_files(root: str) -> Iterator[str]:
+    """Yield the paths of the files under root."""
+    pending = [root]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        yield entry.path
+        except OSError:
+            continue
+
+
+def _files_under(root: str) -> Iterator[str]:
+    """Yield the paths of the project's files under root."""
+    files = _project_files()
+    if files is None:
+        return _walk_files(root)
+    prefix = root.rstrip('/') + '/'
+    return (path for path in files if path.startswith(prefix))
+
+
+def _project_has(path: str) -> bool:
+    """Return True if the project has the file, or files under a path ending in '/'."""
+    files = _project_files()
+    if files is None:
+        return os.path.exists(path)
+    if path.endswith('/'):
+        return any(name.startswith(path) for name in files)
+    return path in files
+
+
+def _tree_contains(root: str, needle: bytes) -> bool:
+    """Return True as soon as a file under root contains needle (like grep -r)."""
+    for path in _files_under(root):
+        try:
+            with open(path, 'rb') as f:
+                if needle in f.read():
+                    return True
+        except OSError:
+            continue  # Unreadable file, skipped like grep does
+    return False
+
+
+def _count_test_files(root: str) -> int:
+    """Count the .py files under root whose path contains 'test_'."""
+    return sum(
+        1 for path in _files_under(root) if path.endswith('.py') and 'test_' in path
+    )
+
+
+def _changed_test_files() -> List[str]:
+    """
+    List the test files changed since the branch point with BASE_BRANCH.
+    
+    Includes uncommitted changes and new, untracked test files. Returns an
+    empty list, meaning the whole suite should run, when none changed or git
+    can't tell.
+    """
+    output = b''
+    # Changes to tracked files, then files git doesn't track yet
+    for command in (
+        ["git", "diff", "--name-only", "-z", "--merge-base", BASE_BRANCH, "--", "tests/"],
+        ["git", "ls-files", "-z", "--others", "--exclude-standard", "--", "tests/"],
+    ):
+        try:
+            result = subprocess.run(
+                command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, timeout=30
+            )
+        except (OSError, subprocess.TimeoutExpired):
+            return []
+        if result.returncode != 0:
+            return []
+        output += result.stdout
+    
+    paths = (os.fsdecode(path) for path in output.split(b'\0') if path)
+    # Only test modules; a changed conftest or helper leaves the list empty
+    # and so runs everything. Deleted files are in the diff too.
+    return [
+        path for path in paths
+        if os.path.basename(path).startswith('test_') and path.endswith('.py')
+        and os.path.exists(path)
+    ]
+
+
+@lru_cache(maxsize=None)
+def _xdist_installed() -> bool:
+    """
+    Return True if the project depends on pytest-xdist.
+    
+    Read from the project's dependency files, since asking its environment
+    would cost another `poetry run`.
+    """
+    for path in ("poetry.lock", "pyproject.toml"):
+        try:
+            with open(path, "rb") as f:
+                if b"pytest-xdist" in f.read():
+                    return True
+        except OSError:
+            continue
+    return False
+
+
+@dataclass(slots=True, frozen=True)
 class ValidationResult:
     """Represents the result of a validation check."""
-    
-    def __init__(self, passed: bool, message: str, details: str = ""):
-        self.passed = passed
-        self.message = message
-        self.details = details
+    passed: bool
+    message: str
+    details: str = ""
 
 
 class StoryValidator:
@@ -24,81 +298,103 @@ class StoryValidator:
     
     def __init__(self, story_id: str):
         self.story_id = story_id
-        self.story_file = Path(f"docs/stories/{story_id}.story.md")
+    
+    @cached_property
+    def story_file(self) -> Path:
+        """The story's document, built on first use since few checks read it."""
+        return Path(f"docs/stories/{self.story_id}.story.md")
+    
+    # Story type named in the validation messages
+    kind = "Story"
     
     def validate(self) -> ValidationResult:
+        """Validate the story; from a running event loop, await validate_async instead."""
+        return asyncio.run(self.validate_async())
+    
+    async def validate_async(self) -> ValidationResult:
+        """Validate the story with the checks for its type."""
+        return await self._run_checks(self._checks(), self.kind)
+    
+    def _checks(self) -> List[Callable[[], Awaitable[ValidationResult]]]:
         """Override in subclasses."""
         raise NotImplementedError
-
-
-class InfrastructureValidator(StoryValidator):
-    """Validates infrastructure stories (Docker, services, deployments)."""
     
-    def validate(self) -> ValidationResult:
-        """Validate infrastructure components."""
-        checks = [
-            self._check_docker_services(),
-            self._check_health_endpoints(),
-            self._check_monitoring_stack(),
-        ]
+    async def _run_checks(
+        self, checks: List[Callable[[], Awaitable[ValidationResult]]], kind: str
+    ) -> ValidationResult:
+        """
+        Run independent checks concurrently and combine their results.
+        
+        The checks mostly wait on subprocesses, which one event loop overlaps
+        without a thread per check. Failed checks are listed in check order.
+        """
+        # Files added since an earlier validation must be seen by this one
+        _list_project_files.cache_clear()
+        # Commands are shared between this validation's checks only
+        token = _command_runs.set({})
+        try:
+            results = await asyncio.gather(*(check() for check in checks))
+        finally:
+            _command_runs.reset(token)
         
-        failed_checks = [check for check in checks if not check.passed]
+        failed_checks = [result for result in results if not result.passed]
         
         if not failed_checks:
             return ValidationResult(
                 True,
-                f"✅ Infrastructure story {self.story_id} validated successfully"
+                f"✅ {kind} story {self.story_id} validated successfully"
             )
         else:
             failed_messages = [check.message for check in failed_checks]
             return ValidationResult(
                 False,
-                f"❌ Infrastructure story {self.story_id} failed validation",
+                f"❌ {kind} story {self.story_id} failed validation",
                 f"Failed checks: {', '.join(failed_messages)}"
             )
+
+
+class InfrastructureValidator(StoryValidator):
+    """Validates infrastructure stories (Docker, services, deployments)."""
+    
+    kind = "Infrastructure"
     
-    def _check_docker_services(self) -> ValidationResult:
+    def _checks(self) -> List[Callable[[], Awaitable[ValidationResult]]]:
+        """Checks validating infrastructure components."""
+        return [
+            self._check_docker_services,
+            self._check_health_endpoints,
+            self._check_monitoring_stack,
+        ]
+    
+    async def _check_docker_services(self) -> ValidationResult:
         """Check if Docker services start successfully."""
         try:
-            result = subprocess.run(
-                ["docker-compose", "config"], 
-                capture_output=True, text=True, timeout=30
-            )
-            if result.returncode == 0:
+            if await _run_once(["docker-compose", "config"], timeout=CONFIG_CHECK_TIMEOUT) == 0:
                 return ValidationResult(True, "Docker compose configuration valid")
             else:
                 return ValidationResult(False, "Docker compose configuration invalid")
         except Exception as e:
             return ValidationResult(False, f"Docker check failed: {e}")
     
-    def _check_health_endpoints(self) -> ValidationResult:
+    async def _check_health_endpoints(self) -> ValidationResult:
         """Check if health endpoints are accessible."""
         try:
             # Check if API is configured for health checks
-            result = subprocess.run(
-                ["grep", "-r", "health", "apps/api/src/"], 
-                capture_output=True, text=True
-            )
-            if "health" in result.stdout.lower():
+            if await asyncio.to_thread(_tree_contains, "apps/api/src", b"health"):
                 return ValidationResult(True, "Health endpoints configured")
             else:
                 return ValidationResult(False, "No health endpoints found")
         except Exception as e:
             return ValidationResult(False, f"Health check failed: {e}")
     
-    def _check_monitoring_stack(self) -> ValidationResult:
+    async def _check_monitoring_stack(self) -> ValidationResult:
         """Check if monitoring configuration exists."""
-        monitoring_files = [
-            "docker-compose.yml",
-            "monitoring/prometheus.yml",
-            "monitoring/grafana/",
+        # Listing the project's files runs git; keep it off the event loop
+        missing_files = [
+            path for path in MONITORING_FILES
+            if not await asyncio.to_thread(_project_has, path)
         ]
         
-        missing_files = []
-        for file_path in monitoring_files:
-            if not Path(file_path).exists():
-                missing_files.append(file_path)
-        
         if not missing_files:
             return ValidationResult(True, "Monitoring stack configured")
         else:
@@ -108,40 +404,27 @@ class InfrastructureValidator(StoryValidator):
 class CodeImplementationValidator(StoryValidator):
     """Validates code implementation stories (new features, APIs, connectors)."""
     
-    def validate(self) -> ValidationResult:
-        """Validate code implementation."""
-        checks = [
-            self._check_tests_exist(),
-            self._check_tests_pass(),
-            self._check_coverage(),
-            self._check_type_safety(),
-            self._check_code_quality(),
+    kind = "Code implementation"
+    
+    def __init__(self, story_id: str):
+        super().__init__(story_id)
+        # The shared pytest run; see _run_test_suite
+        self._test_run = None
+    
+    def _checks(self) -> List[Callable[[], Awaitable[ValidationResult]]]:
+        """Checks validating code implementation."""
+        return [
+            self._check_tests_exist,
+            self._check_tests_pass,
+            self._check_coverage,
+            self._check_type_safety,
+            self._check_code_quality,
         ]
-        
-        failed_checks = [check for check in checks if not check.passed]
-        
-        if not failed_checks:
-            return ValidationResult(
-                True,
-                f"✅ Code implementation story {self.story_id} validated successfully"
-            )
-        else:
-            failed_messages = [check.message for check in failed_checks]
-            return ValidationResult(
-                False,
-                f"❌ Code implementation story {self.story_id} failed validation",
-                f"Failed checks: {', '.join(failed_messages)}"
-            )
     
-    def _check_tests_exist(self) -> ValidationResult:
+    async def _check_tests_exist(self) -> ValidationResult:
         """Check if tests exist for the claimed functionality."""
         try:
-            result = subprocess.run(
-                ["find", "tests/", "-name", "*.py", "-type", "f"],
-                capture_output=True, text=True
-            )
-            test_files = result.stdout.strip().split('\n')
-            test_count = len([f for f in test_files if f and 'test_' in f])
+            test_count = await asyncio.to_thread(_count_test_files, "tests")
             
             if test_count > 0:
                 return ValidationResult(True, f"Found {test_count} test files")
@@ -150,51 +433,82 @@ class CodeImplementationValidator(StoryValidator):
         except Exception as e:
             return ValidationResult(False, f"Test existence check failed: {e}")
     
-    def _check_tests_pass(self) -> ValidationResult:
+    async def _run_test_suite(self) -> int:
+        """
+        Run pytest with coverage once, returning its exit code.
+        
+        Both the pass/fail and the coverage check await this single run; the
+        first caller starts it. An error running pytest is re-raised to each.
+        With AVAAD_FAST_VALIDATE=1 only the changed test files are run.
+        """
+        if self._test_run is None:
+            # Set before the first await, so the other caller shares this run
+            self._test_run = asyncio.ensure_future(self._start_test_suite())
+        return await self._test_run
+    
+    async def _start_test_suite(self) -> int:
+        """Build the pytest command and run it; see _run_test_suite."""
+        command = ["poetry", "run", "pytest", "--cov=apps/api/src", "--cov-report=json",
+                   "-q", "--tb=short"]
+        # These read the dependency files and run git; keep them off the loop
+        if await asyncio.to_thread(_xdist_installed):
+            # Spread tests over all cores; pytest-cov combines the
+            # workers' data before writing coverage.json
+            command += ["-n", "auto"]
+        if os.environ.get(FAST_VALIDATE_ENV) == "1":
+            command += await asyncio.to_thread(_changed_test_files)
+        return await _exec(command, timeout=300)
+    
+    async def _check_tests_pass(self) -> ValidationResult:
         """Check if all tests pass."""
         try:
-            result = subprocess.run(
-                ["poetry", "run", "pytest", "-v", "--tb=short"],
-                capture_output=True, text=True, timeout=300
-            )
-            if result.returncode == 0:
+            if await self._run_test_suite() == 0:
                 return ValidationResult(True, "All tests pass")
             else:
                 return ValidationResult(False, "Some tests are failing")
         except Exception as e:
             return ValidationResult(False, f"Test execution failed: {e}")
     
-    def _check_coverage(self) -> ValidationResult:
+    async def _check_coverage(self) -> ValidationResult:
         """Check test coverage meets requirements."""
         try:
-            result = subprocess.run(
-                ["poetry", "run", "pytest", "--cov=apps/api/src", "--cov-report=json", "-q"],
-                capture_output=True, text=True, timeout=300
-            )
+            await self._run_test_suite()
             
-            if Path("coverage.json").exists():
-                with open("coverage.json") as f:
-                    coverage_data = json.load(f)
-                    coverage = coverage_data['totals']['percent_covered']
-                    
-                    if coverage >= 90:
-                        return ValidationResult(True, f"Coverage: {coverage:.1f}% (≥90%)")
-                    else:
-                        return ValidationResult(False, f"Coverage: {coverage:.1f}% (<90%)")
-            else:
+            try:
+                with open("coverage.json", "rb") as f:
+                    report = f.read()
+            except FileNotFoundError:
                 return ValidationResult(False, "Coverage report not generated")
+            
+            loads = orjson.loads if orjson is not None else json.loads
+            coverage = loads(report)['totals']['percent_covered']
+            
+            if coverage >= 90:
+                return ValidationResult(True, f"Coverage: {coverage:.1f}% (≥90%)")
+            else:
+                return ValidationResult(False, f"Coverage: {coverage:.1f}% (<90%)")
         except Exception as e:
             return ValidationResult(False, f"Coverage check failed: {e}")
     
-    def _check_type_safety(self) -> ValidationResult:
+    async def _check_type_safety(self) -> ValidationResult:
         """Check MyPy type safety."""
         try:
-            result = subprocess.run(
-                ["poetry", "run", "mypy", "--strict", "apps/api/src"],
-                capture_output=True, text=True
+            # Error lines are counted as mypy writes them, on the raw bytes,
+            # instead of decoding and scanning its whole output at the end
+            error_count = 0
+            
+            async def count_errors(stdout: asyncio.StreamReader) -> None:
+                nonlocal error_count
+                async for line in stdout:
+                    if MYPY_ERROR_MARKER in line:
+                        error_count += 1
+            
+            await _exec(
+                ["poetry", "run", "mypy", "--strict", "--no-pretty", "--no-error-summary",
+                 "apps/api/src"],
+                timeout=300, read_output=count_errors
             )
             
-            error_count = result.stdout.count(": error:")
             if error_count == 0:
                 return ValidationResult(True, "Type checking passed")
             else:
@@ -202,14 +516,10 @@ class CodeImplementationValidator(StoryValidator):
         except Exception as e:
             return ValidationResult(False, f"Type checking failed: {e}")
     
-    def _check_code_quality(self) -> ValidationResult:
+    async def _check_code_quality(self) -> ValidationResult:
         """Check code quality with linting tools."""
         try:
-            result = subprocess.run(
-                ["poetry", "run", "ruff", "check", "apps/api/src"],
-                capture_output=True, text=True
-            )
-            if result.returncode == 0:
+            if await _run_once(["poetry", "run", "ruff", "check", "apps/api/src"]) == 0:
                 return ValidationResult(True, "Code quality checks passed")
             else:
                 return ValidationResult(False, "Code quality issues found")
@@ -220,102 +530,181 @@ class CodeImplementationValidator(StoryValidator):
 class ConfigurationValidator(StoryValidator):
     """Validates configuration and tooling stories (linting, MyPy, tool setup)."""
     
-    def validate(self) -> ValidationResult:
-        """Validate configuration changes."""
-        checks = [
-            self._check_linting(),
-            self._check_configuration_files(),
-            self._check_pre_commit_hooks(),
+    kind = "Configuration"
+    
+    def _checks(self) -> List[Callable[[], Awaitable[ValidationResult]]]:
+        """Checks validating configuration changes."""
+        return [
+            self._check_linting,
+            self._check_configuration_files,
+            self._check_pre_commit_hooks,
         ]
-        
-        failed_checks = [check for check in checks if not check.passed]
-        
-        if not failed_checks:
-            return ValidationResult(
-                True,
-                f"✅ Configuration story {self.story_id} validated successfully"
-            )
-        else:
-            failed_messages = [check.message for check in failed_checks]
-            return ValidationResult(
-                False,
-                f"❌ Configuration story {self.story_id} failed validation",
-                f"Failed checks: {', '.join(failed_messages)}"
-            )
     
-    def _check_linting(self) -> ValidationResult:
+    async def _check_linting(self) -> ValidationResult:
         """Check if linting passes."""
         try:
-            result = subprocess.run(
-                ["make", "lint"], capture_output=True, text=True, timeout=120
-            )
-            if result.returncode == 0:
+            # Ruff is run directly rather than through make and a shell
+            if await _run_once(LINT_COMMAND, timeout=120) == 0:
                 return ValidationResult(True, "All linting checks pass")
             else:
                 return ValidationResult(False, "Linting failures detected")
         except Exception as e:
             return ValidationResult(False, f"Linting check failed: {e}")
     
-    def _check_configuration_files(self) -> ValidationResult:
+    async def _check_configuration_files(self) -> ValidationResult:
         """Check configuration file validity."""
-        config_files = {
-            "pyproject.toml": ["poetry", "check"],
-            "docker-compose.yml": ["docker-compose", "config"],
-            ".pre-commit-config.yaml": ["pre-commit", "validate-config"],
-        }
+        checks = [
+            (file_path, check_command)
+            for file_path, check_command in CONFIG_FILE_CHECKS.items()
+            if os.path.exists(file_path)
+        ]
+        if not checks:
+            return ValidationResult(True, "Configuration files valid")
         
-        for file_path, check_command in config_files.items():
-            if Path(file_path).exists():
-                try:
-                    result = subprocess.run(
-                        check_command, capture_output=True, text=True, timeout=30
-                    )
-                    if result.returncode != 0:
-                        return ValidationResult(False, f"Invalid {file_path}")
-                except Exception:
-                    return ValidationResult(False, f"Cannot validate {file_path}")
+        # The validation tools run concurrently; the first failure in
+        # CONFIG_FILE_CHECKS order is reported, as when they ran one by one,
+        # without waiting for the tools still running after it
+        runs = [
+            _start_once(check_command, timeout=CONFIG_CHECK_TIMEOUT)
+            for _, check_command in checks
+        ]
+        for (file_path, _), run in zip(checks, runs):
+            try:
+                if await asyncio.shield(run) != 0:
+                    return ValidationResult(False, f"Invalid {file_path}")
+            except Exception:
+                return ValidationResult(False, f"Cannot validate {file_path}")
         
         return ValidationResult(True, "Configuration files valid")
     
-    def _check_pre_commit_hooks(self) -> ValidationResult:
+    async def _check_pre_commit_hooks(self) -> ValidationResult:
         """Check if pre-commit hooks are properly configured."""
         try:
-            result = subprocess.run(
-                ["pre-commit", "run", "--all-files", "--dry-run"],
-                capture_output=True, text=True, timeout=60
-            )
-            # Even dry-run should exit cleanly if configuration is valid
-            if "error" not in result.stderr.lower():
-                return ValidationResult(True, "Pre-commit hooks configured")
-            else:
-                return ValidationResult(False, "Pre-commit hook configuration issues")
+            # Only the hook configuration is checked; these parse the YAML
+            # without installing or running any hooks
+            commands = [["pre-commit", "validate-config"]]
+            if os.path.exists(".pre-commit-hooks.yaml"):
+                commands.append(["pre-commit", "validate-manifest"])
+            
+            for command in commands:
+                if await _run_once(command, timeout=CONFIG_CHECK_TIMEOUT) != 0:
+                    return ValidationResult(False, "Pre-commit hook configuration issues")
+            return ValidationResult(True, "Pre-commit hooks configured")
         except Exception as e:
             return ValidationResult(False, f"Pre-commit check failed: {e}")
 
 
+# Story types; a story listed in several takes the first type listed
+INFRASTRUCTURE_STORIES = frozenset({"1.1", "1.2", "1.5", "1.6"})
+CODE_STORIES = frozenset({"1.4", "1.5A", "1.5B", "1.3", "1.7"})
+# Configuration stories (including MyPy and linting)
+CONFIG_STORIES = frozenset({"6.1", "6.2", "1.1.5", "hotfix-mypy-fixes", "utils-linting-fix"})
+
+# Validator class for each known story; later entries win, giving the
+# infrastructure > code > configuration precedence
+STORY_VALIDATORS = {
+    **dict.fromkeys(CONFIG_STORIES, ConfigurationValidator),
+    **dict.fromkeys(CODE_STORIES, CodeImplementationValidator),
+    **dict.fromkeys(INFRASTRUCTURE_STORIES, InfrastructureValidator),
+}
+
+
 def get_validator(story_id: str) -> StoryValidator:
     """Factory function to get appropriate validator for story type."""
+    # Default to configuration validator for unknown stories
+    return STORY_VALIDATORS.get(story_id, ConfigurationValidator)(story_id)
+
+
+def _repo_fingerprint() -> Optional[str]:
+    """
+    Hash the repository state: HEAD plus the size and mtime of changed files.
     
-    # Infrastructure stories
-    infrastructure_stories = ["1.1", "1.2", "1.5", "1.6"]
-    if story_id in infrastructure_stories:
-        return InfrastructureValidator(story_id)
+    Returns None when the state can't be determined (not a git checkout, git
+    missing), in which case results are not cached.
+    """
+    excludes = [f":(exclude){path}" for path in FINGERPRINT_EXCLUDES]
+    try:
+        head = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, timeout=10
+        )
+        status = subprocess.run(
+            ["git", "status", "--porcelain", "-z", "--untracked-files=all", "--", ".", *excludes],
+            capture_output=True, timeout=30
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
     
-    # Code implementation stories
-    code_stories = ["1.4", "1.5A", "1.5B", "1.3", "1.7"]
-    if story_id in code_stories:
-        return CodeImplementationValidator(story_id)
+    if head.returncode != 0 or status.returncode != 0:
+        return None
     
-    # Configuration stories (including MyPy and linting)
-    config_stories = ["6.1", "6.2", "1.1.5", "hotfix-mypy-fixes", "utils-linting-fix"]
-    if story_id in config_stories:
-        return ConfigurationValidator(story_id)
+    digest = hashlib.blake2b(head.stdout, digest_size=16)
+    digest.update(status.stdout)
     
-    # Default to configuration validator for unknown stories
-    return ConfigurationValidator(story_id)
+    # Status only says a file is modified; its stat tells one edit from the next
+    records = iter(status.stdout.split(b'\0'))
+    for record in records:
+        if not record:
+            continue
+        if record[0:1] in (b'R', b'C'):
+            next(records, None)  # Renames and copies are followed by the source path
+        try:
+            stat = os.stat(record[3:])
+        except OSError:
+            continue
+        digest.update(f"{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+    
+    return digest.hexdigest()
 
 
-def validate_story(story_id: str) -> ValidationResult:
-    """Main validation entry point."""
-    validator = get_validator(story_id)
-    return validator.validate()
\ No newline at end of file
+def _load_cache() -> dict:
+    """Load the result cache from disk once per process."""
+    global _cache
+    if _cache is None:
+        try:
+            with open(CACHE_FILE, 'r') as f:
+                _cache = json.load(f)
+        except (OSError, ValueError):
+            _cache = {}
+    return _cache
+
+
+def _save_cache(cache: dict) -> None:
+    """Write the most recent CACHE_SIZE results back to disk."""
+    while len(cache) > CACHE_SIZE:
+        del cache[next(iter(cache))]
+    try:
+        CACHE_FILE.parent.mkdir(exist_ok=True)
+        with open(CACHE_FILE, 'w') as f:
+            json.dump(cache, f, indent=2)
+    except OSError:
+        pass
+
+
+def validate_story(story_id: str, use_cache: bool = True) -> ValidationResult:
+    """
+    Main validation entry point.
+    
+    Passes are reused while the repository is unchanged; pass
+    use_cache=False to force the checks to run. Failures are never cached,
+    since they may come from the environment (a tool missing, Docker down,
+    a timeout) and must be re-checked once it is fixed.
+    
+    The fingerprint only covers files git sees, so a change to an ignored
+    input (e.g. a .env file read by docker-compose) doesn't invalidate a
+    cached pass; use use_cache=False after such a change.
+    """
+    fingerprint = _repo_fingerprint() if use_cache else None
+    if fingerprint is None:
+        return get_validator(story_id).validate()
+    
+    cache = _load_cache()
+    fast = os.environ.get(FAST_VALIDATE_ENV) == "1"
+    key = f"{story_id}:{fingerprint}" + (":fast" if fast else "")
+    if key in cache:
+        return ValidationResult(*cache[key])
+    
+    result = get_validator(story_id).validate()
+    if result.passed:
+        cache[key] = [result.passed, result.message, result.details]
+        _save_cache(cache)
+    return result
\ No newline at end of file